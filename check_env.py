@@ -9,6 +9,35 @@ import os
 import sys
 from dotenv import load_dotenv
 
+def _mask(value):
+    """Mask an API key value for display."""
+    return value[:10] + "..." + value[-5:] if len(value) > 15 else "***"
+
+def _snapshot(vars_to_check, api_key_vars):
+    """
+    Take one pass over the environment and return display values of set variables.
+    
+    API keys are masked; unset or empty variables are skipped.
+    """
+    env_get = os.environ.get
+    snapshot = {var: env_get(var) for var in vars_to_check}
+    return {
+        var: _mask(value) if var in api_key_vars else value
+        for var, value in snapshot.items()
+        if value
+    }
+
+def _print_phase(current, before, note):
+    """Print a phase snapshot, flagging values that differ from ``before``."""
+    changed = set() if current == before else {
+        var for var, shown in current.items() if before.get(var, shown) != shown
+    }
+    for var, shown in current.items():
+        if var in changed:
+            print(f"  {var}: {shown} ({note})")
+        else:
+            print(f"  {var}: {shown}")
+
 def check_env_conflicts():
     """Check for environment variables that might conflict with .env settings."""
     # List of environment variables to check
@@ -35,20 +64,12 @@ def check_env_conflicts():
         "LANGSMITH_PROJECT",
         "LANGSMITH_TRACING",
     ]
+    api_key_vars = frozenset(var for var in vars_to_check if "API_KEY" in var)
     
     print("=== Environment Variables Before Loading .env File ===")
     
     # Check each variable before loading .env
-    env_vars_before = {}
-    for var in vars_to_check:
-        value = os.environ.get(var)
-        if value:
-            # Mask API keys for security
-            if "API_KEY" in var and value:
-                masked_value = value[:10] + "..." + value[-5:] if len(value) > 15 else "***"
-                env_vars_before[var] = masked_value
-            else:
-                env_vars_before[var] = value
+    env_vars_before = _snapshot(vars_to_check, api_key_vars)
     
     # Print results for pre-.env check
     if env_vars_before:
@@ -69,42 +90,14 @@ def check_env_conflicts():
         
         # Check what variables are now set
         print("\n=== Environment Variables After Loading .env (without override) ===")
-        for var in vars_to_check:
-            value = os.environ.get(var)
-            if value:
-                # Mask API keys for security
-                if "API_KEY" in var and value:
-                    masked_value = value[:10] + "..." + value[-5:] if len(value) > 15 else "***"
-                    if var in env_vars_before and env_vars_before[var] != masked_value:
-                        print(f"  {var}: {masked_value} (CONFLICT! Original value was kept)")
-                    else:
-                        print(f"  {var}: {masked_value}")
-                else:
-                    if var in env_vars_before and env_vars_before[var] != value:
-                        print(f"  {var}: {value} (CONFLICT! Original value was kept)")
-                    else:
-                        print(f"  {var}: {value}")
+        _print_phase(_snapshot(vars_to_check, api_key_vars), env_vars_before, "CONFLICT! Original value was kept")
         
         # Now load with override
         load_dotenv(dotenv_path, override=True)
         
         # Check what variables are now set
         print("\n=== Environment Variables After Loading .env (with override=True) ===")
-        for var in vars_to_check:
-            value = os.environ.get(var)
-            if value:
-                # Mask API keys for security
-                if "API_KEY" in var and value:
-                    masked_value = value[:10] + "..." + value[-5:] if len(value) > 15 else "***"
-                    if var in env_vars_before and env_vars_before[var] != masked_value:
-                        print(f"  {var}: {masked_value} (OVERRIDDEN from original value)")
-                    else:
-                        print(f"  {var}: {masked_value}")
-                else:
-                    if var in env_vars_before and env_vars_before[var] != value:
-                        print(f"  {var}: {value} (OVERRIDDEN from original value)")
-                    else:
-                        print(f"  {var}: {value}")
+        _print_phase(_snapshot(vars_to_check, api_key_vars), env_vars_before, "OVERRIDDEN from original value")
     else:
         print(f"No .env file found at: {dotenv_path}")
     
@@ -1,13 +1,11 @@
 # Description: Test script to verify the OpenAI API key and model configuration.
 import os
 from langchain_openai import ChatOpenAI
-from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv(override=True)
+from src.config import settings
 
-# Get API key from environment
-api_key = os.getenv("OPENAI_API_KEY")
+# Prefer the key from the .env file over any value already set in the environment
+api_key = settings.DOTENV_VALUES.get("OPENAI_API_KEY") or settings.OPENAI_API_KEY
 
 # Clear any existing environment variable and set the one from .env
 os.environ["OPENAI_API_KEY"] = api_key
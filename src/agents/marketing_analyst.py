@@ -4,28 +4,22 @@ Marketing Analyst Agent Implementation.
 This module implements the core marketing analyst agent using LangChain components.
 """
 
-from typing import Dict, List, Any, Optional
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Any, Optional
+import functools
 import logging
+import re
 
-from langchain.agents import AgentExecutor, create_openai_functions_agent
-from langchain_openai import ChatOpenAI
-from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain.tools.base import BaseTool
-from langchain.memory import ConversationBufferMemory
-from langchain.schema.runnable import Runnable, RunnablePassthrough
-from langchain.schema.messages import SystemMessage, HumanMessage, AIMessage
-from langchain.schema.output import LLMResult
 from langchain.llms.base import LLM
-from langsmith import Client as LangSmithClient
 
 from src.config import settings
-from src.tools.market_data import (
-    MarketTrendAnalysisTool,
-    CompetitorAnalysisTool,
-    ConsumerSentimentTool
-)
-from src.tools.report import ReportGenerationTool
-from src.tools.strategy import StrategyRecommendationTool
+
+if TYPE_CHECKING:
+    from langchain.tools.base import BaseTool
+
+# Heavy LangChain/LangSmith modules and the tool classes are imported lazily
+# inside the methods that need them, so --help and DEBUG_MODE start quickly.
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -46,17 +40,11 @@ Follow these principles in your analysis:
 You have access to various tools that can help you analyze marketing data and generate insights.
 """
 
-# Mock LLM for debug mode
-class MockLLM(LLM):
-    """A mock LLM that returns predefined responses for debugging purposes."""
-    
-    def _call(self, prompt: str, **kwargs) -> str:
-        """Return a mock response."""
-        logger.info(f"DEBUG MODE: Using mock LLM response for prompt: {prompt[:100]}...")
-        
-        # Return a simple response that just tells the user what tools would be used
-        if "mobile gaming" in prompt.lower():
-            return """Based on the market trend analysis tool, here are the key trends in the mobile gaming market:
+_STRATEGY_RESPONSE = "I would develop strategic recommendations using the strategy recommendation tool based on your business objectives."
+
+# Canned mock responses keyed by trigger keyword, in priority order
+_MOCK_RESPONSES = {
+    "mobile gaming": """Based on the market trend analysis tool, here are the key trends in the mobile gaming market:
 
 1. Increasing mobile engagement - More users are spending longer sessions on mobile games, with average session times increasing by 15% year over year.
 
@@ -67,17 +55,86 @@ class MockLLM(LLM):
 4. Integration of AI-driven analytics - Developers are leveraging AI tools to understand player behavior and optimize game mechanics.
 
 The mobile gaming market has shown a growth rate of 12.5% over the past year, with a current market size of $8.7 billion. This growth is expected to continue as mobile devices become more powerful and 5G adoption increases.
-"""
-        elif "competitor" in prompt.lower():
-            return "I would analyze this using the competitor analysis tool to provide insights on market positioning, strengths, and weaknesses."
-        elif "sentiment" in prompt.lower():
-            return "I would use the consumer sentiment analysis tool to evaluate how users feel about this product across different channels."
-        elif "report" in prompt.lower():
-            return "I would generate a comprehensive report using the report generation tool with the sections you requested."
-        elif "strategy" in prompt.lower() or "recommend" in prompt.lower():
-            return "I would develop strategic recommendations using the strategy recommendation tool based on your business objectives."
-        else:
-            return "I'd need to analyze this request further. Could you provide more details about what specific marketing insights you're looking for?"
+""",
+    "competitor": "I would analyze this using the competitor analysis tool to provide insights on market positioning, strengths, and weaknesses.",
+    "sentiment": "I would use the consumer sentiment analysis tool to evaluate how users feel about this product across different channels.",
+    "report": "I would generate a comprehensive report using the report generation tool with the sections you requested.",
+    "strategy": _STRATEGY_RESPONSE,
+    "recommend": _STRATEGY_RESPONSE,
+}
+_MOCK_RANKED_RESPONSES = tuple(_MOCK_RESPONSES.values())
+# One named group per keyword, k<rank>, so a match identifies its keyword
+# without normalising the matched text
+_MOCK_PATTERN = re.compile(
+    "|".join(
+        f"(?P<k{rank}>{re.escape(keyword)})" for rank, keyword in enumerate(_MOCK_RESPONSES)
+    ),
+    re.IGNORECASE
+)
+_MOCK_DEFAULT_RESPONSE = "I'd need to analyze this request further. Could you provide more details about what specific marketing insights you're looking for?"
+
+@functools.lru_cache(maxsize=1)
+def _default_tools() -> tuple:
+    """
+    Build the default tool instances once per process.
+    
+    The tools hold no per-agent state, so every agent shares the same instances.
+    
+    Returns:
+        tuple: Tool instances in the order they are offered to the agent
+    """
+    from src.tools.market_data import (
+        MarketTrendAnalysisTool,
+        CompetitorAnalysisTool,
+        ConsumerSentimentTool
+    )
+    from src.tools.report import BatchReportGenerationTool, ReportGenerationTool
+    from src.tools.strategy import StrategyRecommendationTool
+
+    return (
+        MarketTrendAnalysisTool(),
+        CompetitorAnalysisTool(),
+        ConsumerSentimentTool(),
+        ReportGenerationTool(),
+        BatchReportGenerationTool(),
+        StrategyRecommendationTool(),
+    )
+
+@functools.lru_cache(maxsize=1)
+def _get_prompt():
+    """
+    Build the agent prompt template once per process.
+    
+    The prompt is fully static, so every agent shares the same template.
+    
+    Returns:
+        ChatPromptTemplate: The marketing analyst prompt
+    """
+    from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
+    from langchain.schema.messages import SystemMessage, HumanMessage
+
+    return ChatPromptTemplate.from_messages([
+        SystemMessage(content=MARKETING_ANALYST_SYSTEM_PROMPT),
+        MessagesPlaceholder(variable_name="chat_history"),
+        HumanMessage(content="{input}"),
+        MessagesPlaceholder(variable_name="agent_scratchpad"),
+    ])
+
+# Mock LLM for debug mode
+class MockLLM(LLM):
+    """A mock LLM that returns predefined responses for debugging purposes."""
+    
+    def _call(self, prompt: str, **kwargs) -> str:
+        """Return a mock response."""
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("DEBUG MODE: Using mock LLM response for prompt: %s...", prompt[:100])
+        
+        # Return a simple response that just tells the user what tools would be used.
+        # A single scan finds every keyword; the highest-priority one wins.
+        ranks = {int(match.lastgroup[1:]) for match in _MOCK_PATTERN.finditer(prompt)}
+        if not ranks:
+            return _MOCK_DEFAULT_RESPONSE
+        return _MOCK_RANKED_RESPONSES[min(ranks)]
     
     @property
     def _llm_type(self) -> str:
@@ -88,11 +145,26 @@ class MarketingAnalystAgent:
     Marketing Analyst Agent implementation using LangChain components.
     """
     
+    __slots__ = (
+        "model_name",
+        "enable_tracing",
+        "verbose",
+        "memory_window",
+        "langsmith_client",
+        "llm",
+        "tools",
+        "memory",
+        "prompt",
+        "agent",
+        "agent_executor",
+    )
+    
     def __init__(
         self,
         model_name: str = settings.DEFAULT_MODEL,
         enable_tracing: bool = settings.ENABLE_TRACING,
-        verbose: bool = True
+        verbose: bool = True,
+        memory_window: int = settings.MEMORY_WINDOW
     ):
         """
         Initialize the Marketing Analyst Agent.
@@ -101,14 +173,19 @@ class MarketingAnalystAgent:
             model_name: The name of the OpenAI model to use
             enable_tracing: Whether to enable LangSmith tracing
             verbose: Whether to enable verbose logging
+            memory_window: Number of recent conversation turns kept in memory
         """
         self.model_name = model_name
         self.enable_tracing = enable_tracing
         self.verbose = verbose
+        self.memory_window = memory_window
+        self.langsmith_client = None
         
         # Initialize LangSmith client if tracing is enabled and not in debug mode
         if self.enable_tracing and not settings.DEBUG_MODE:
             if settings.LANGSMITH_API_KEY:
+                from langsmith import Client as LangSmithClient
+
                 self.langsmith_client = LangSmithClient()
             else:
                 logger.warning("LangSmith API key not provided, tracing disabled")
@@ -119,26 +196,41 @@ class MarketingAnalystAgent:
     
     def _setup_agent(self) -> None:
         """Set up the agent with tools, prompt, and memory."""
-        # Initialize the language model
-        model_kwargs = settings.get_model_kwargs()
+        model_kwargs = settings.MODEL_KWARGS
         
-        # Use mock LLM in debug mode
+        # In DEBUG mode, skip the tools, memory, prompt and OpenAI functions agent:
+        # a simple executor that just runs the mock LLM never consumes them
         if settings.DEBUG_MODE:
+            from langchain.schema.runnable import RunnablePassthrough
+
             logger.info("Running in DEBUG MODE with mock LLM")
             self.llm = MockLLM()
-        else:
-            self.llm = ChatOpenAI(
-                model=self.model_name,
-                temperature=model_kwargs["temperature"],
-                max_tokens=model_kwargs["max_tokens"],
-                api_key=settings.OPENAI_API_KEY,
-            )
+            self.tools = ()
+            self.memory = None
+            self.prompt = None
+            self.agent = RunnablePassthrough()
+            self.agent_executor = self._create_debug_agent_executor()
+            return
+        
+        from langchain.agents import AgentExecutor, create_openai_functions_agent
+        from langchain.memory import ConversationBufferWindowMemory
+        from langchain_openai import ChatOpenAI
+
+        # Initialize the language model
+        self.llm = ChatOpenAI(
+            model=self.model_name,
+            temperature=model_kwargs["temperature"],
+            max_tokens=model_kwargs["max_tokens"],
+            api_key=settings.OPENAI_API_KEY,
+        )
         
         # Initialize the tools
         self.tools = self._get_tools()
         
-        # Initialize the memory - using the newer format to avoid deprecation warning
-        self.memory = ConversationBufferMemory(
+        # Initialize the memory - a bounded window keeps prompt size constant in
+        # long sessions; using the newer format to avoid deprecation warning
+        self.memory = ConversationBufferWindowMemory(
+            k=self.memory_window,
             return_messages=True,
             input_key="input",
             output_key="output",
@@ -146,35 +238,23 @@ class MarketingAnalystAgent:
         )
         
         # Initialize the prompt
-        self.prompt = ChatPromptTemplate.from_messages([
-            SystemMessage(content=MARKETING_ANALYST_SYSTEM_PROMPT),
-            MessagesPlaceholder(variable_name="chat_history"),
-            HumanMessage(content="{input}"),
-            MessagesPlaceholder(variable_name="agent_scratchpad"),
-        ])
+        self.prompt = _get_prompt()
         
-        # Create the agent (simplified in DEBUG_MODE)
-        if settings.DEBUG_MODE:
-            # In DEBUG mode, we'll skip the OpenAI functions agent creation
-            # and create a simple agent executor that just runs the mock LLM
-            self.agent = RunnablePassthrough()
-            self.agent_executor = self._create_debug_agent_executor()
-        else:
-            # Normal agent setup
-            self.agent = create_openai_functions_agent(
-                llm=self.llm,
-                tools=self.tools,
-                prompt=self.prompt
-            )
-            
-            # Create the agent executor
-            self.agent_executor = AgentExecutor(
-                agent=self.agent,
-                tools=self.tools,
-                memory=self.memory,
-                verbose=self.verbose,
-                handle_parsing_errors=True,
-            )
+        # Create the agent
+        self.agent = create_openai_functions_agent(
+            llm=self.llm,
+            tools=self.tools,
+            prompt=self.prompt
+        )
+        
+        # Create the agent executor
+        self.agent_executor = AgentExecutor(
+            agent=self.agent,
+            tools=self.tools,
+            memory=self.memory,
+            verbose=self.verbose,
+            handle_parsing_errors=True,
+        )
     
     def _create_debug_agent_executor(self):
         """Create a simplified agent executor for debug mode that just calls the mock LLM."""
@@ -194,13 +274,7 @@ class MarketingAnalystAgent:
         Returns:
             List[BaseTool]: List of tools
         """
-        return [
-            MarketTrendAnalysisTool(),
-            CompetitorAnalysisTool(),
-            ConsumerSentimentTool(),
-            ReportGenerationTool(),
-            StrategyRecommendationTool(),
-        ]
+        return list(_default_tools())
     
     def run(self, input_text: str = None, query: str = None) -> Dict[str, Any]:
         """
@@ -224,7 +298,7 @@ class MarketingAnalystAgent:
                 "success": True
             }
         except Exception as e:
-            logger.error(f"Error running agent: {str(e)}")
+            logger.error("Error running agent: %s", e)
             return {
                 "response": f"An error occurred: {str(e)}",
                 "success": False
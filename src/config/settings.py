@@ -3,46 +3,86 @@ Environment and configuration settings for the Marketing Analyst Agent.
 """
 
 import os
-from dotenv import load_dotenv
-from typing import Optional, Dict, Any
+import functools
+from types import MappingProxyType
+from dotenv import dotenv_values, find_dotenv
+from typing import Optional, Dict, Any, Mapping
 
-# Load environment variables from .env file
-load_dotenv()
+# Parse the .env file once; values already present in the process environment
+# take precedence, matching the non-override behaviour of load_dotenv()
+_DOTENV_PATH = find_dotenv()
+DOTENV_VALUES = MappingProxyType(dict(dotenv_values(_DOTENV_PATH)) if _DOTENV_PATH else {})
+_ENV = MappingProxyType({**DOTENV_VALUES, **os.environ})
+
+# Export .env values so third-party clients (OpenAI, LangSmith) still see them
+for _key, _value in DOTENV_VALUES.items():
+    if _value is not None:
+        os.environ.setdefault(_key, _value)
 
 # API Keys
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-LANGCHAIN_API_KEY = os.getenv("LANGCHAIN_API_KEY")
-LANGSMITH_API_KEY = os.getenv("LANGSMITH_API_KEY")
-LANGSMITH_PROJECT = os.getenv("LANGSMITH_PROJECT", "marketing_analyst_agent")
+OPENAI_API_KEY = _ENV.get("OPENAI_API_KEY")
+LANGCHAIN_API_KEY = _ENV.get("LANGCHAIN_API_KEY")
+LANGSMITH_API_KEY = _ENV.get("LANGSMITH_API_KEY")
+LANGSMITH_PROJECT = _ENV.get("LANGSMITH_PROJECT", "marketing_analyst_agent")
 
 # Agent Configuration
-DEFAULT_MODEL = os.getenv("DEFAULT_MODEL", "gpt-4")
-AGENT_TEMPERATURE = float(os.getenv("AGENT_TEMPERATURE", "0.2"))
-AGENT_MAX_TOKENS = int(os.getenv("AGENT_MAX_TOKENS", "2000"))
+DEFAULT_MODEL = _ENV.get("DEFAULT_MODEL", "gpt-4")
+AGENT_TEMPERATURE = float(_ENV.get("AGENT_TEMPERATURE", "0.2"))
+AGENT_MAX_TOKENS = int(_ENV.get("AGENT_MAX_TOKENS", "2000"))
+MODEL_KWARGS = MappingProxyType({
+    "temperature": AGENT_TEMPERATURE,
+    "max_tokens": AGENT_MAX_TOKENS,
+})
+
+def _env_positive_int(name: str, default: str) -> int:
+    """
+    Read a setting that must be a positive integer.
+    
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is not set
+        
+    Returns:
+        int: The setting's value
+        
+    Raises:
+        ValueError: If the value is not a positive integer
+    """
+    value = int(_ENV.get(name, default))
+    if value < 1:
+        raise ValueError(f"{name} must be a positive integer, got {value}")
+    return value
+
+# Number of recent conversation turns kept in the agent's memory window
+MEMORY_WINDOW = _env_positive_int("MEMORY_WINDOW", "10")
 
 # Storage Configuration
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///marketing_agent.db")
+DATABASE_URL = _ENV.get("DATABASE_URL", "sqlite:///marketing_agent.db")
+# Redis instance used to cache tool results; caching is off when unset
+REDIS_URL = _ENV.get("REDIS_URL")
 
 # Feature Flags
-ENABLE_TRACING = os.getenv("ENABLE_TRACING", "true").lower() == "true"
-ENABLE_CACHING = os.getenv("ENABLE_CACHING", "true").lower() == "true"
+ENABLE_TRACING = _ENV.get("ENABLE_TRACING", "true").lower() == "true"
+ENABLE_CACHING = _ENV.get("ENABLE_CACHING", "true").lower() == "true"
 
 # Debug Mode - set to True to bypass API key validation
-DEBUG_MODE = os.getenv("DEBUG_MODE", "true").lower() == "true"
+DEBUG_MODE = _ENV.get("DEBUG_MODE", "true").lower() == "true"
 
 # Check if required environment variables are set
-def validate_env() -> Dict[str, str]:
+@functools.lru_cache(maxsize=1)
+def validate_env() -> Mapping[str, str]:
     """
     Validate that all required environment variables are set.
     
     Returns:
-        Dict[str, str]: Dictionary of missing or invalid environment variables
+        Mapping[str, str]: Read-only mapping of missing or invalid environment
+                           variables; the result is cached and shared by callers
     """
     issues = {}
     
     # Skip validation if in DEBUG_MODE
     if DEBUG_MODE:
-        return issues
+        return MappingProxyType(issues)
     
     if not OPENAI_API_KEY:
         issues["OPENAI_API_KEY"] = "Missing OpenAI API key"
@@ -50,16 +90,13 @@ def validate_env() -> Dict[str, str]:
     if ENABLE_TRACING and not LANGSMITH_API_KEY:
         issues["LANGSMITH_API_KEY"] = "LangSmith API key required when tracing is enabled"
     
-    return issues
+    return MappingProxyType(issues)
 
-def get_model_kwargs() -> Dict[str, Any]:
+def get_model_kwargs() -> Mapping[str, Any]:
     """
     Get keyword arguments for the language model.
     
     Returns:
-        Dict[str, Any]: Dictionary of model configuration parameters
+        Mapping[str, Any]: Read-only mapping of model configuration parameters
     """
-    return {
-        "temperature": AGENT_TEMPERATURE,
-        "max_tokens": AGENT_MAX_TOKENS,
-    } 
\ No newline at end of file
+    return MODEL_KWARGS 
\ No newline at end of file
@@ -11,7 +11,7 @@ from typing import Dict, Any, Optional, List
 
 from src.agents.marketing_analyst import MarketingAnalystAgent
 from src.config import settings
-from src.utils.formatting import format_cli_response, highlight_text
+from src.utils.formatting import color_enabled, compile_highlighter, format_cli_response, highlight_text
 
 # Configure logging
 logging.basicConfig(
@@ -35,11 +35,32 @@ def validate_environment() -> bool:
     if issues:
         logger.error("Environment validation failed:")
         for key, message in issues.items():
-            logger.error(f"  - {key}: {message}")
+            logger.error("  - %s: %s", key, message)
         return False
     
     return True
 
+def positive_int(value: str) -> int:
+    """
+    Parse a command line value that must be a positive integer.
+    
+    Args:
+        value: Raw argument value
+        
+    Returns:
+        int: The parsed value
+        
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a positive integer
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {number}")
+    return number
+
 def parse_arguments() -> argparse.Namespace:
     """
     Parse command line arguments.
@@ -74,6 +95,13 @@ def parse_arguments() -> argparse.Namespace:
         help="Enable verbose output"
     )
     
+    parser.add_argument(
+        "--memory-window",
+        type=positive_int,
+        default=settings.MEMORY_WINDOW,
+        help=f"Number of recent conversation turns to keep in memory (default: {settings.MEMORY_WINDOW})"
+    )
+    
     parser.add_argument(
         "--highlight", 
         type=str,
@@ -91,10 +119,27 @@ def run_interactive_mode(agent: MarketingAnalystAgent, highlight_terms: Optional
         agent: The marketing analyst agent instance
         highlight_terms: Optional terms to highlight in responses
     """
-    print("\n===== Marketing Analyst Agent (Interactive Mode) =====")
-    print("Enter your queries and get marketing insights.")
-    print("Type 'exit', 'quit', or 'q' to exit.")
-    print("=================================================\n")
+    # Enable line editing and history for input() where available
+    try:
+        import readline  # noqa: F401
+    except ImportError:
+        pass
+    
+    write = sys.stdout.write
+    flush = sys.stdout.flush
+    
+    write("\n".join([
+        "",
+        "===== Marketing Analyst Agent (Interactive Mode) =====",
+        "Enter your queries and get marketing insights.",
+        "Type 'exit', 'quit', or 'q' to exit.",
+        "=================================================\n\n",
+    ]))
+    flush()
+    
+    # Compile the highlight terms once for the whole session; skip
+    # highlighting entirely when the output cannot show color
+    highlighter = compile_highlighter(highlight_terms) if highlight_terms and color_enabled() else None
     
     while True:
         try:
@@ -107,21 +152,22 @@ def run_interactive_mode(agent: MarketingAnalystAgent, highlight_terms: Optional
             if not query.strip():
                 continue
                 
-            print("\nProcessing query...")
+            write("\nProcessing query...\n")
+            flush()
             response = agent.run(query)
             
             formatted_response = format_cli_response(response["response"])
-            if highlight_terms:
-                formatted_response = highlight_text(formatted_response, highlight_terms)
+            if highlighter:
+                formatted_response = highlight_text(formatted_response, highlighter)
                 
-            print("\nResponse:")
-            print(formatted_response)
+            sys.stdout.writelines(["\nResponse:\n", formatted_response, "\n"])
+            flush()
             
         except KeyboardInterrupt:
             print("\nExiting...")
             break
         except Exception as e:
-            logger.error(f"Error processing query: {str(e)}")
+            logger.error("Error processing query: %s", e)
             print(f"\nAn error occurred: {str(e)}")
 
 def main() -> int:
@@ -138,23 +184,24 @@ def main() -> int:
     if not validate_environment():
         return 1
     
-    logger.info(f"Initializing Marketing Analyst Agent with model: {args.model}")
+    logger.info("Initializing Marketing Analyst Agent with model: %s", args.model)
     
     try:
         # Initialize the agent
         agent = MarketingAnalystAgent(
             model_name=args.model,
             enable_tracing=not args.no_tracing,
-            verbose=args.verbose
+            verbose=args.verbose,
+            memory_window=args.memory_window
         )
         
         # Run query or interactive mode
         if args.query:
-            logger.info(f"Running query: {args.query}")
+            logger.info("Running query: %s", args.query)
             response = agent.run(query=args.query)
             
             formatted_response = format_cli_response(response["response"])
-            if args.highlight:
+            if args.highlight and color_enabled():
                 formatted_response = highlight_text(formatted_response, args.highlight)
                 
             print(formatted_response)
@@ -164,7 +211,7 @@ def main() -> int:
         return 0
     
     except Exception as e:
-        logger.error(f"Error running agent: {str(e)}")
+        logger.error("Error running agent: %s", e)
         return 1
 
 if __name__ == "__main__":
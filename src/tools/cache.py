@@ -0,0 +1,136 @@
+"""
+Result caching for the Marketing Analyst Agent tools.
+
+This module provides a Redis-backed cache for tool results, keyed by the
+tool name and its canonicalised arguments, with a per-tool TTL.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+import functools
+import hashlib
+import logging
+
+import orjson
+
+from src.config import settings
+
+try:
+    import redis
+except ImportError:  # redis is optional; without it results are not shared
+    redis = None
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Number of results kept in-process for use when Redis is unavailable
+_STALE_MAX_ENTRIES = 1024
+
+# Seconds to wait on Redis before treating it as unavailable; kept short so an
+# unreachable server falls back to stale results instead of stalling tool calls
+_SOCKET_TIMEOUT = 0.2
+
+class ToolCache:
+    """
+    Redis-backed cache of serialized tool results.
+    
+    Every value written to Redis is also kept in a small in-process store, so
+    a stale result can still be served if Redis becomes unavailable.
+    """
+    
+    def __init__(self, url: Optional[str] = None):
+        """
+        Initialize the cache.
+        
+        Args:
+            url: Redis connection URL; caching is disabled when not provided
+                 or when the redis package is not installed
+        """
+        if url and redis is None:
+            logger.warning("Tool caching disabled: the optional redis package is not installed")
+        self.client = (
+            redis.Redis.from_url(
+                url,
+                socket_connect_timeout=_SOCKET_TIMEOUT,
+                socket_timeout=_SOCKET_TIMEOUT
+            )
+            if (url and redis is not None) else None
+        )
+        self._stale: "OrderedDict[str, bytes]" = OrderedDict()
+    
+    @property
+    def enabled(self) -> bool:
+        """Whether results are being cached."""
+        return self.client is not None
+    
+    @staticmethod
+    def make_key(tool_name: str, arguments: Dict[str, Any]) -> str:
+        """
+        Build the cache key for a tool call.
+        
+        Args:
+            tool_name: Name of the tool
+            arguments: Arguments the tool was called with
+            
+        Returns:
+            str: Cache key derived from the canonical JSON of the arguments
+        """
+        canonical = orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS)
+        digest = hashlib.blake2b(canonical).hexdigest()[:16]
+        return f"tool:{tool_name}:{digest}"
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Get a cached value.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Optional[bytes]: Cached value, or None on a miss
+        """
+        if self.client is None:
+            return None
+
+        try:
+            return self.client.get(key)
+        except redis.RedisError as e:
+            stale = self._stale.get(key)
+            if stale is None:
+                logger.warning("Tool cache unavailable: %s", e)
+            else:
+                logger.warning("Tool cache unavailable, serving stale result: %s", e)
+            return stale
+    
+    def set(self, key: str, value: bytes, ttl: int) -> None:
+        """
+        Cache a value.
+        
+        Args:
+            key: Cache key
+            value: Serialized value
+            ttl: Time to live in seconds
+        """
+        if self.client is None:
+            return
+
+        self._stale[key] = value
+        self._stale.move_to_end(key)
+        if len(self._stale) > _STALE_MAX_ENTRIES:
+            self._stale.popitem(last=False)
+
+        try:
+            self.client.set(key, value, ex=ttl)
+        except redis.RedisError as e:
+            logger.warning("Failed to write to tool cache: %s", e)
+
+@functools.lru_cache(maxsize=1)
+def get_tool_cache() -> ToolCache:
+    """
+    Get the shared tool cache configured from settings.
+    
+    Returns:
+        ToolCache: Shared cache instance
+    """
+    url = settings.REDIS_URL if settings.ENABLE_CACHING else None
+    return ToolCache(url)
@@ -5,18 +5,165 @@ This module provides tools for analyzing market trends, competitor data,
 and consumer sentiment.
 """
 
-from typing import Dict, List, Any, Optional, Type
-import json
+from typing import Callable, ClassVar, Dict, List, Any, Optional, Tuple, Type
+import asyncio
+import functools
+import hashlib
 import logging
-from pydantic import BaseModel, Field
+import numpy as np
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from langchain.tools import BaseTool, tool
 
+from src.tools.cache import get_tool_cache
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Mock market trend metrics; results are serialized, so these are never handed out
+_GROWTH_RATE_METRIC = {
+    "value": 12.5,
+    "unit": "percent",
+    "trend": "increasing"
+}
+_MARKET_SIZE_METRIC = {
+    "value": 8.7,
+    "unit": "billion USD",
+    "trend": "growing"
+}
+_KEY_TRENDS = (
+    "Increasing mobile engagement",
+    "Greater emphasis on sustainability",
+    "Shift toward personalized experiences",
+    "Integration of AI-driven analytics"
+)
+
+# Bit assigned to each trend metric, so requested metrics fold into one mask
+_GROWTH_RATE_BIT = 1
+_MARKET_SIZE_BIT = 2
+_KEY_TRENDS_BIT = 4
+_METRIC_BITS = {
+    "growth_rate": _GROWTH_RATE_BIT,
+    "market_size": _MARKET_SIZE_BIT,
+    "key_trends": _KEY_TRENDS_BIT
+}
+
+# Analysis summary templates, filled with str.format_map
+_TREND_SUMMARY_TMPL = (
+    "The {market_segment} market has shown a growth rate of 12.5% during {time_period}, "
+    "with a current market size of $8.7 billion. Key trends include increasing mobile "
+    "engagement, greater emphasis on sustainability, shift toward personalized "
+    "experiences, and integration of AI-driven analytics."
+)
+_COMPETITOR_SUMMARY_TMPL = (
+    "Analysis for {time_period} shows {leader_name} as the market leader with "
+    "{leader_share}% market share, positioned as a {leader_position} brand. "
+    "The competitive landscape consists of {competitor_count} major players."
+)
+_SENTIMENT_SUMMARY_TMPL = (
+    "Consumer sentiment for {product_or_brand} during {time_period} is predominantly "
+    "{sentiment} with a sentiment score of {sentiment_score}/100. "
+    "Sentiment is {trend} over time. "
+    "Analysis covered {channel_count} channels including {channels_joined}."
+)
+
+# Mock competitor attributes, selected per competitor from a stable digest
+_COMPETITOR_METRICS = frozenset({"market_share", "positioning", "strengths", "weaknesses"})
+_POSITIONS = ("premium", "value", "innovator", "established", "disruptor")
+_STRENGTH_OPTIONS = (
+    "Strong brand recognition",
+    "Innovative product development",
+    "Efficient supply chain",
+    "Customer loyalty",
+    "Marketing effectiveness"
+)
+_WEAKNESS_OPTIONS = (
+    "High prices",
+    "Limited market reach",
+    "Product quality issues",
+    "Slow to innovate",
+    "Poor customer service"
+)
+
+# Byte layout of the per-competitor digest used to derive mock values
+_DIGEST_SIZE = 16
+_SHARE_BYTES = slice(0, 2)
+_TREND_BYTE = 2
+_POSITION_BYTE = 3
+_STRENGTH_BYTES = slice(4, 4 + len(_STRENGTH_OPTIONS))
+_WEAKNESS_BYTES = slice(_STRENGTH_BYTES.stop, _STRENGTH_BYTES.stop + len(_WEAKNESS_OPTIONS))
+
+def _digest_matrix(names: Tuple[str, ...]) -> np.ndarray:
+    """
+    Hash each name to a row of stable pseudo-random bytes.
+    
+    Unlike the built-in hash(), blake2b does not depend on PYTHONHASHSEED, so
+    mock values are reproducible across runs.
+    
+    Returns:
+        np.ndarray: uint8 array of shape (len(names), _DIGEST_SIZE)
+    """
+    digests = b"".join(
+        hashlib.blake2b(name.encode(), digest_size=_DIGEST_SIZE).digest() for name in names
+    )
+    return np.frombuffer(digests, dtype=np.uint8).reshape(len(names), _DIGEST_SIZE)
+
+# Sentiment label for each integer score 0-100, and trend label per hash bucket
+_SENTIMENT_LABEL = tuple(
+    "negative" if score <= 40 else "neutral" if score <= 70 else "positive"
+    for score in range(101)
+)
+_TREND_LABEL = ("improving", "stable", "declining")
+_KEY_TOPICS = (
+    "product quality",
+    "customer service",
+    "price",
+    "features",
+    "user experience"
+)
+
+# Seeds for _h, one per sentiment use site so the derived values are independent
+_SCORE_SEED = 0
+_CHANNEL_ADJUST_SEED = 1
+_SAMPLE_SIZE_SEED = 2
+_TOPIC_COUNT_SEED = 3
+_TREND_SEED = 4
+_CHANNEL_SEEDS = (_CHANNEL_ADJUST_SEED, _SAMPLE_SIZE_SEED, _TOPIC_COUNT_SEED)
+
+def _h(text: str, seed: int = 0) -> int:
+    """
+    Stable, seedable 64-bit hash of a string.
+    
+    Args:
+        text: String to hash
+        seed: Seed selecting an independent hash function
+        
+    Returns:
+        int: Non-negative 64-bit hash value
+    """
+    digest = hashlib.blake2b(text.encode(), digest_size=8, salt=seed.to_bytes(16, "little"))
+    return int.from_bytes(digest.digest(), "little")
+
 # Tool Input Schemas
+# Inputs are immutable once validated, reject unknown fields, and strip
+# surrounding whitespace from strings. Validators are built at import rather
+# than on the first tool call, and assignment is never re-validated.
+_INPUT_CONFIG = ConfigDict(
+    frozen=True,
+    extra="forbid",
+    str_strip_whitespace=True,
+    validate_assignment=False,
+    defer_build=False
+)
+
+def _dedupe(values: List[str]) -> List[str]:
+    """Drop repeated entries while keeping the first-seen order."""
+    return list(dict.fromkeys(values))
+
 class MarketTrendAnalysisInput(BaseModel):
     """Input for market trend analysis."""
+    model_config = _INPUT_CONFIG
+    
     market_segment: str = Field(
         ..., 
         description="The market segment to analyze (e.g., 'luxury fashion', 'mobile gaming')"
@@ -29,9 +176,17 @@ class MarketTrendAnalysisInput(BaseModel):
         default=["growth_rate", "market_size", "key_trends"],
         description="Metrics to analyze"
     )
+    
+    @field_validator("metrics")
+    @classmethod
+    def canonical_metrics(cls, value: List[str]) -> List[str]:
+        """Output does not depend on metric order, so sort once for stable cache keys."""
+        return sorted(set(value))
 
 class CompetitorAnalysisInput(BaseModel):
     """Input for competitor analysis."""
+    model_config = _INPUT_CONFIG
+    
     competitors: List[str] = Field(
         ..., 
         description="List of competitor names to analyze"
@@ -44,9 +199,17 @@ class CompetitorAnalysisInput(BaseModel):
         default="current", 
         description="Time period for the analysis"
     )
+    
+    @field_validator("metrics")
+    @classmethod
+    def dedupe_metrics(cls, value: List[str]) -> List[str]:
+        """Drop repeated metrics; order is kept because it shapes the output."""
+        return _dedupe(value)
 
 class ConsumerSentimentInput(BaseModel):
     """Input for consumer sentiment analysis."""
+    model_config = _INPUT_CONFIG
+    
     product_or_brand: str = Field(
         ..., 
         description="Product or brand to analyze consumer sentiment for"
@@ -59,9 +222,278 @@ class ConsumerSentimentInput(BaseModel):
         default="last 3 months", 
         description="Time period for the analysis"
     )
+    
+    @field_validator("channels")
+    @classmethod
+    def dedupe_channels(cls, value: List[str]) -> List[str]:
+        """Drop repeated channels; order is kept because it shapes the output."""
+        return _dedupe(value)
+
+# Numeric kernels
+# Stable hashes are computed in Python once per name; everything derived from
+# them is plain array arithmetic over all competitors or channels at once.
+def _competitor_numbers(digests: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Derive the numeric competitor mock values from their digests.
+    
+    Args:
+        digests: uint8 array of shape (n, _DIGEST_SIZE) from _digest_matrix
+        
+    Returns:
+        Tuple: Market share (n,), stable share flag (n,), positioning index (n,),
+               strengths mask (n, 5) and weaknesses mask (n, 5)
+    """
+    share_bytes = digests[:, _SHARE_BYTES].astype(np.uint16)
+    share_raw = (share_bytes[:, 0] | (share_bytes[:, 1] << 8)) % 100
+    market_shares = np.round(5 + 20 * share_raw / 100, 1)  # Between 5-25%
+    share_stable = digests[:, _TREND_BYTE] % 3 == 0
+    position_idx = digests[:, _POSITION_BYTE] % len(_POSITIONS)
+    strengths_mask = digests[:, _STRENGTH_BYTES] % 3 == 0
+    weaknesses_mask = (digests[:, _WEAKNESS_BYTES] & 0b11) == 0
+    return market_shares, share_stable, position_idx, strengths_mask, weaknesses_mask
+
+def _sentiment_numbers(brand_seed: int, channel_seeds: np.ndarray) -> Tuple[int, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Derive the numeric sentiment mock values from stable hashes.
+    
+    Args:
+        brand_seed: _h of the product or brand with _SCORE_SEED
+        channel_seeds: uint64 array of shape (n, 3) holding each channel's _h with
+                       _CHANNEL_ADJUST_SEED, _SAMPLE_SIZE_SEED and _TOPIC_COUNT_SEED
+        
+    Returns:
+        Tuple: Overall score, channel scores (n,), sample sizes (n,) and
+               key topic counts (n,)
+    """
+    overall_score = 65 + brand_seed % 30  # Random between 65-95
+    adjustments = (channel_seeds[:, 0] % 20).astype(np.int64) - 10
+    channel_scores = np.clip(overall_score + adjustments, 0, 100)
+    sample_sizes = 500 + channel_seeds[:, 1] % 1500
+    topic_counts = 3 + channel_seeds[:, 2] % 3
+    return overall_score, channel_scores, sample_sizes, topic_counts
+
+# Mock data generators
+#
+# The tools are pure functions of their inputs, so results are memoised. The
+# cache holds serialized JSON and every call decodes its own copy, so callers
+# are free to mutate what they get back.
+@functools.lru_cache(maxsize=512)
+def _cached_trend(market_segment: str, time_period: str, metrics: Tuple[str, ...]) -> bytes:
+    """Build serialized market trend mock data for a canonicalised set of metrics."""
+    # This would typically call an external API or database
+    # For demonstration, we'll return mock data
+    mock_data = {
+        "market_segment": market_segment,
+        "time_period": time_period,
+        "metrics": {},
+        "analysis_summary": ""
+    }
+
+    # Generate mock data for requested metrics (constants, copied on serialization)
+    mask = 0
+    for metric in metrics:
+        mask |= _METRIC_BITS.get(metric, 0)
+
+    if mask & _GROWTH_RATE_BIT:
+        mock_data["metrics"]["growth_rate"] = _GROWTH_RATE_METRIC
+
+    if mask & _MARKET_SIZE_BIT:
+        mock_data["metrics"]["market_size"] = _MARKET_SIZE_METRIC
+
+    if mask & _KEY_TRENDS_BIT:
+        mock_data["metrics"]["key_trends"] = _KEY_TRENDS
+
+    # Generate a summary based on the mock data
+    mock_data["analysis_summary"] = _TREND_SUMMARY_TMPL.format_map({
+        "market_segment": market_segment,
+        "time_period": time_period
+    })
+
+    return orjson.dumps(mock_data)
+
+@functools.lru_cache(maxsize=512)
+def _cached_competitor(competitors: Tuple[str, ...], metrics: Tuple[str, ...], time_period: str) -> bytes:
+    """Build serialized competitor analysis mock data."""
+    # This would typically call an external API or database
+    # For demonstration, we'll return mock data
+    mock_data = {
+        "competitors": {},
+        "time_period": time_period,
+        "analysis_summary": ""
+    }
+
+    # Derive every competitor's mock numbers in one vectorised pass
+    market_shares, share_stable, position_idx, strengths_mask, weaknesses_mask = (
+        _competitor_numbers(_digest_matrix(competitors))
+    )
+
+    # Build one column of values per requested metric, indexed like competitors
+    columns: Dict[str, List[Any]] = {}
+    if "market_share" in metrics:
+        columns["market_share"] = [
+            {"value": value, "unit": "percent", "trend": "stable" if stable else "increasing"}
+            for value, stable in zip(market_shares.tolist(), share_stable.tolist())
+        ]
+
+    if "positioning" in metrics:
+        columns["positioning"] = [_POSITIONS[i] for i in position_idx.tolist()]
+
+    if "strengths" in metrics:
+        columns["strengths"] = [
+            [strength for strength, selected in zip(_STRENGTH_OPTIONS, mask) if selected]
+            for mask in strengths_mask.tolist()
+        ]
+
+    if "weaknesses" in metrics:
+        columns["weaknesses"] = [
+            [weakness for weakness, selected in zip(_WEAKNESS_OPTIONS, mask) if selected]
+            for mask in weaknesses_mask.tolist()
+        ]
+
+    # Assemble the per-competitor view only for the response, keeping the
+    # requested metric order; unsupported metrics are reported as empty dicts
+    requested_columns = [(metric, columns[metric]) for metric in metrics if metric in columns]
+    unknown_metrics = [metric for metric in metrics if metric not in _COMPETITOR_METRICS]
+    mock_data["competitors"] = {
+        competitor: {metric: column[i] for metric, column in requested_columns}
+        for i, competitor in enumerate(competitors)
+    }
+    if unknown_metrics:
+        for competitor_data in mock_data["competitors"].values():
+            competitor_data.update({metric: {} for metric in unknown_metrics})
+
+    # Generate a summary
+    if competitors:
+        leader_idx = int(np.argmax(market_shares)) if "market_share" in columns else 0
+        mock_data["analysis_summary"] = _COMPETITOR_SUMMARY_TMPL.format_map({
+            "time_period": time_period,
+            "leader_name": competitors[leader_idx],
+            "leader_share": columns["market_share"][leader_idx]["value"] if "market_share" in columns else "unknown",
+            "leader_position": columns["positioning"][leader_idx] if "positioning" in columns else "unknown",
+            "competitor_count": len(competitors)
+        })
+
+    return orjson.dumps(mock_data)
+
+@functools.lru_cache(maxsize=512)
+def _cached_sentiment(product_or_brand: str, channels: Tuple[str, ...], time_period: str) -> bytes:
+    """Build serialized consumer sentiment mock data."""
+    # This would typically call an external API or database
+    # For demonstration, we'll return mock data
+    mock_data = {
+        "product_or_brand": product_or_brand,
+        "time_period": time_period,
+        "channels": {},
+        "overall_sentiment": {},
+        "analysis_summary": ""
+    }
+
+    channel_seeds = np.array(
+        [[_h(channel, seed) for seed in _CHANNEL_SEEDS] for channel in channels],
+        dtype=np.uint64
+    ).reshape(len(channels), len(_CHANNEL_SEEDS))
+    overall_sentiment_score, channel_scores, sample_sizes, topic_counts = _sentiment_numbers(
+        _h(product_or_brand, _SCORE_SEED), channel_seeds
+    )
+
+    # Generate channel-specific sentiment
+    for channel, channel_score, sample_size, topic_count in zip(
+        channels, channel_scores.tolist(), sample_sizes.tolist(), topic_counts.tolist()
+    ):
+        mock_data["channels"][channel] = {
+            "sentiment_score": channel_score,
+            "sentiment": _SENTIMENT_LABEL[channel_score],
+            "sample_size": sample_size,
+            "key_topics": _KEY_TOPICS[:topic_count]
+        }
+
+    # Overall sentiment
+    mock_data["overall_sentiment"] = {
+        "sentiment_score": overall_sentiment_score,
+        "sentiment": _SENTIMENT_LABEL[overall_sentiment_score],
+        "trend": _TREND_LABEL[_h(product_or_brand, _TREND_SEED) % len(_TREND_LABEL)]
+    }
+
+    # Generate a summary
+    mock_data["analysis_summary"] = _SENTIMENT_SUMMARY_TMPL.format_map({
+        "product_or_brand": product_or_brand,
+        "time_period": time_period,
+        **mock_data["overall_sentiment"],
+        "channel_count": len(channels),
+        "channels_joined": ", ".join(channels)
+    })
+
+    return orjson.dumps(mock_data)
 
 # Tool implementations
-class MarketTrendAnalysisTool(BaseTool):
+class _LazyJoin:
+    """Comma-joins items only when a log record is actually formatted."""
+    
+    __slots__ = ("items",)
+    
+    def __init__(self, items: List[str]):
+        self.items = items
+    
+    def __str__(self) -> str:
+        return ", ".join(self.items)
+
+class _MarketDataTool(BaseTool):
+    """Shared behaviour for the market data tools."""
+    
+    # Seconds a cached result stays valid; tuned per tool to its data's refresh rate
+    ttl: ClassVar[int] = 24 * 3600
+    
+    def _parse_input(self, tool_input, *args, **kwargs):
+        """
+        Validate JSON object strings with the args schema in a single pass.
+        
+        Tool arguments often arrive as a JSON string; model_validate_json parses
+        and validates it directly instead of building an intermediate dict first.
+        """
+        if isinstance(tool_input, str) and tool_input.lstrip().startswith("{"):
+            return dict(self.args_schema.model_validate_json(tool_input))
+        return super()._parse_input(tool_input, *args, **kwargs)
+    
+    async def _arun(self, **kwargs) -> Dict[str, Any]:
+        """
+        Run the tool without blocking the event loop.
+        
+        The three market data tools are independent, so callers can fan them
+        out with asyncio.gather(trend_tool.arun(...), competitor_tool.arun(...),
+        sentiment_tool.arun(...)). When a tool is backed by a real API, replace
+        this with an async client call (e.g. an aiohttp.ClientSession).
+        
+        Returns:
+            Dict[str, Any]: The same results as _run
+        """
+        return await asyncio.to_thread(self._run, **kwargs)
+    
+    def _cached_result(self, arguments: Dict[str, Any], generate: Callable[[], bytes]) -> Dict[str, Any]:
+        """
+        Return the cached result for these arguments, generating it on a miss.
+        
+        Hits and misses both decode the same serialized JSON, so the result has
+        the same types whether or not it came from the cache.
+        
+        Args:
+            arguments: Arguments the tool was called with
+            generate: Produces the serialized result when it is not cached
+            
+        Returns:
+            Dict[str, Any]: Tool results
+        """
+        cache = get_tool_cache()
+        if not cache.enabled:
+            return orjson.loads(generate())
+        
+        key = cache.make_key(self.name, arguments)
+        serialized = cache.get(key)
+        if serialized is None:
+            serialized = generate()
+            cache.set(key, serialized, self.ttl)
+        return orjson.loads(serialized)
+
+class MarketTrendAnalysisTool(_MarketDataTool):
     """Tool for analyzing market trends."""
     name: str = "market_trend_analysis"
     description: str = """
@@ -70,6 +502,7 @@ class MarketTrendAnalysisTool(BaseTool):
     identify key trends, market size, growth rate, and other relevant metrics.
     """
     args_schema: Type[BaseModel] = MarketTrendAnalysisInput
+    ttl: ClassVar[int] = 7 * 24 * 3600
     
     def _run(self, market_segment: str, time_period: str, metrics: List[str]) -> Dict[str, Any]:
         """
@@ -83,51 +516,14 @@ class MarketTrendAnalysisTool(BaseTool):
         Returns:
             Dict[str, Any]: Market trend analysis results
         """
-        logger.info(f"Running market trend analysis for {market_segment} over {time_period}")
-        
-        # This would typically call an external API or database
-        # For demonstration, we'll return mock data
-        mock_data = {
-            "market_segment": market_segment,
-            "time_period": time_period,
-            "metrics": {},
-            "analysis_summary": ""
-        }
+        logger.info("Running market trend analysis for %s over %s", market_segment, time_period)
         
-        # Generate mock data for requested metrics
-        if "growth_rate" in metrics:
-            mock_data["metrics"]["growth_rate"] = {
-                "value": 12.5,
-                "unit": "percent",
-                "trend": "increasing"
-            }
-            
-        if "market_size" in metrics:
-            mock_data["metrics"]["market_size"] = {
-                "value": 8.7,
-                "unit": "billion USD",
-                "trend": "growing"
-            }
-            
-        if "key_trends" in metrics:
-            mock_data["metrics"]["key_trends"] = [
-                "Increasing mobile engagement",
-                "Greater emphasis on sustainability",
-                "Shift toward personalized experiences",
-                "Integration of AI-driven analytics"
-            ]
-        
-        # Generate a summary based on the mock data
-        mock_data["analysis_summary"] = (
-            f"The {market_segment} market has shown a growth rate of 12.5% during {time_period}, "
-            f"with a current market size of $8.7 billion. Key trends include increasing mobile "
-            f"engagement, greater emphasis on sustainability, shift toward personalized "
-            f"experiences, and integration of AI-driven analytics."
+        return self._cached_result(
+            {"market_segment": market_segment, "time_period": time_period, "metrics": metrics},
+            lambda: _cached_trend(market_segment, time_period, tuple(metrics))
         )
-        
-        return mock_data
 
-class CompetitorAnalysisTool(BaseTool):
+class CompetitorAnalysisTool(_MarketDataTool):
     """Tool for analyzing competitors."""
     name: str = "competitor_analysis"
     description: str = """
@@ -136,6 +532,7 @@ class CompetitorAnalysisTool(BaseTool):
     market share, strengths, weaknesses, and strategies.
     """
     args_schema: Type[BaseModel] = CompetitorAnalysisInput
+    ttl: ClassVar[int] = 24 * 3600
     
     def _run(self, competitors: List[str], metrics: List[str], time_period: str) -> Dict[str, Any]:
         """
@@ -149,72 +546,14 @@ class CompetitorAnalysisTool(BaseTool):
         Returns:
             Dict[str, Any]: Competitor analysis results
         """
-        logger.info(f"Running competitor analysis for {', '.join(competitors)} ({time_period})")
-        
-        # This would typically call an external API or database
-        # For demonstration, we'll return mock data
-        mock_data = {
-            "competitors": {},
-            "time_period": time_period,
-            "analysis_summary": ""
-        }
+        logger.info("Running competitor analysis for %s (%s)", _LazyJoin(competitors), time_period)
         
-        # Generate mock data for each competitor
-        for competitor in competitors:
-            competitor_data = {metric: {} for metric in metrics}
-            
-            if "market_share" in metrics:
-                competitor_data["market_share"] = {
-                    "value": round(5 + 20 * hash(competitor) % 100 / 100, 1),  # Random between 5-25%
-                    "unit": "percent",
-                    "trend": "stable" if hash(competitor) % 3 == 0 else "increasing"
-                }
-                
-            if "positioning" in metrics:
-                positions = ["premium", "value", "innovator", "established", "disruptor"]
-                competitor_data["positioning"] = positions[hash(competitor) % len(positions)]
-                
-            if "strengths" in metrics:
-                strengths = [
-                    "Strong brand recognition",
-                    "Innovative product development",
-                    "Efficient supply chain",
-                    "Customer loyalty",
-                    "Marketing effectiveness"
-                ]
-                competitor_data["strengths"] = [strengths[i] for i in range(len(strengths)) if hash(competitor + str(i)) % 3 == 0]
-                
-            if "weaknesses" in metrics:
-                weaknesses = [
-                    "High prices",
-                    "Limited market reach",
-                    "Product quality issues",
-                    "Slow to innovate",
-                    "Poor customer service"
-                ]
-                competitor_data["weaknesses"] = [weaknesses[i] for i in range(len(weaknesses)) if hash(competitor + str(i)) % 4 == 0]
-            
-            mock_data["competitors"][competitor] = competitor_data
-        
-        # Generate a summary
-        market_leaders = sorted(
-            mock_data["competitors"].items(), 
-            key=lambda x: x[1].get("market_share", {}).get("value", 0), 
-            reverse=True
+        return self._cached_result(
+            {"competitors": competitors, "metrics": metrics, "time_period": time_period},
+            lambda: _cached_competitor(tuple(competitors), tuple(metrics), time_period)
         )
-        if market_leaders:
-            leader_name, leader_data = market_leaders[0]
-            leader_share = leader_data.get("market_share", {}).get("value", "unknown")
-            leader_position = leader_data.get("positioning", "unknown")
-            mock_data["analysis_summary"] = (
-                f"Analysis for {time_period} shows {leader_name} as the market leader with "
-                f"{leader_share}% market share, positioned as a {leader_position} brand. "
-                f"The competitive landscape consists of {len(competitors)} major players."
-            )
-        
-        return mock_data
 
-class ConsumerSentimentTool(BaseTool):
+class ConsumerSentimentTool(_MarketDataTool):
     """Tool for analyzing consumer sentiment."""
     name: str = "consumer_sentiment_analysis"
     description: str = """
@@ -223,6 +562,7 @@ class ConsumerSentimentTool(BaseTool):
     a product or brand based on social media, reviews, and surveys.
     """
     args_schema: Type[BaseModel] = ConsumerSentimentInput
+    ttl: ClassVar[int] = 3600
     
     def _run(self, product_or_brand: str, channels: List[str], time_period: str) -> Dict[str, Any]:
         """
@@ -236,53 +576,10 @@ class ConsumerSentimentTool(BaseTool):
         Returns:
             Dict[str, Any]: Consumer sentiment analysis results
         """
-        logger.info(f"Running sentiment analysis for {product_or_brand} over {time_period}")
-        
-        # This would typically call an external API or database
-        # For demonstration, we'll return mock data
-        mock_data = {
-            "product_or_brand": product_or_brand,
-            "time_period": time_period,
-            "channels": {},
-            "overall_sentiment": {},
-            "analysis_summary": ""
-        }
+        logger.info("Running sentiment analysis for %s over %s", product_or_brand, time_period)
         
-        sentiment_options = ["positive", "neutral", "negative"]
-        overall_sentiment_score = 65 + (hash(product_or_brand) % 30)  # Random between 65-95
-        
-        # Generate channel-specific sentiment
-        for channel in channels:
-            channel_score = max(0, min(100, overall_sentiment_score + (hash(channel) % 20 - 10)))
-            sentiment = "positive" if channel_score > 70 else "neutral" if channel_score > 40 else "negative"
-            
-            mock_data["channels"][channel] = {
-                "sentiment_score": channel_score,
-                "sentiment": sentiment,
-                "sample_size": 500 + (hash(channel) % 1500),
-                "key_topics": [
-                    "product quality",
-                    "customer service",
-                    "price",
-                    "features",
-                    "user experience"
-                ][:3 + hash(channel) % 3]
-            }
-        
-        # Overall sentiment
-        mock_data["overall_sentiment"] = {
-            "sentiment_score": overall_sentiment_score,
-            "sentiment": "positive" if overall_sentiment_score > 70 else "neutral" if overall_sentiment_score > 40 else "negative",
-            "trend": "improving" if hash(product_or_brand) % 3 == 0 else "stable" if hash(product_or_brand) % 3 == 1 else "declining"
-        }
-        
-        # Generate a summary
-        mock_data["analysis_summary"] = (
-            f"Consumer sentiment for {product_or_brand} during {time_period} is predominantly "
-            f"{mock_data['overall_sentiment']['sentiment']} with a sentiment score of "
-            f"{mock_data['overall_sentiment']['sentiment_score']}/100. "
-            f"Sentiment is {mock_data['overall_sentiment']['trend']} over time. "
-            f"Analysis covered {len(channels)} channels including {', '.join(channels)}."
+        return self._cached_result(
+            {"product_or_brand": product_or_brand, "channels": channels, "time_period": time_period},
+            lambda: _cached_sentiment(product_or_brand, tuple(channels), time_period)
         )
-        
-        return mock_data 
\ No newline at end of file
+
@@ -4,124 +4,51 @@ Report generation tools for the Marketing Analyst Agent.
 This module provides tools for generating marketing reports based on analyzed data.
 """
 
-from typing import Dict, List, Any, Optional, Type
-import json
+from typing import Callable, Dict, Final, Iterable, Iterator, List, Any, Optional, Type
+import functools
+import io
 import logging
-from datetime import datetime
+import sys
+from datetime import date
+import mistune
+import orjson
 from pydantic import BaseModel, Field
 from langchain.tools import BaseTool, tool
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Tool Input Schema
-class ReportGenerationInput(BaseModel):
-    """Input for report generation."""
-    report_type: str = Field(
-        ...,
-        description="Type of report to generate (e.g., 'market_overview', 'campaign_performance', 'competitor_analysis')"
-    )
-    time_period: str = Field(
-        ...,
-        description="Time period covered by the report (e.g., 'Q1 2023', 'last 6 months')"
-    )
-    include_sections: List[str] = Field(
-        default=["executive_summary", "data_analysis", "recommendations"],
-        description="Sections to include in the report"
-    )
-    format: str = Field(
-        default="markdown",
-        description="Format of the generated report (markdown, html, json)"
-    )
-    data_sources: Optional[List[str]] = Field(
-        default=None,
-        description="Specific data sources to include in the report"
-    )
+# Markdown to HTML converter for report sections; the table plugin renders the
+# pipe tables used in the data analysis and competitive landscape sections
+_MD = mistune.create_markdown(escape=False, plugins=["table"])
 
-class ReportGenerationTool(BaseTool):
-    """Tool for generating marketing reports."""
-    name: str = "generate_marketing_report"
-    description: str = """
-    Generates comprehensive marketing reports based on analyzed data.
-    Use this tool when you need to create a structured report about market trends,
-    campaign performance, competitor analysis, or other marketing insights.
-    The report can include executive summaries, detailed data analysis, and recommendations.
-    """
-    args_schema: Type[BaseModel] = ReportGenerationInput
-    
-    def _run(
-        self, 
-        report_type: str, 
-        time_period: str, 
-        include_sections: List[str],
-        format: str = "markdown",
-        data_sources: Optional[List[str]] = None
-    ) -> Dict[str, Any]:
-        """
-        Generate a marketing report.
-        
-        Args:
-            report_type: Type of report to generate
-            time_period: Time period covered by the report
-            include_sections: Sections to include in the report
-            format: Format of the generated report
-            data_sources: Specific data sources to include
-            
-        Returns:
-            Dict[str, Any]: Generated report data
-        """
-        logger.info(f"Generating {report_type} report for {time_period}")
-        
-        # This would typically compile data from various sources and generate a report
-        # For demonstration, we'll return a mock report
-        
-        if data_sources is None:
-            data_sources = ["internal_analytics", "market_research", "competitor_data"]
-            
-        # Get current date for the report
-        current_date = datetime.now().strftime("%Y-%m-%d")
-        
-        # Initialize report structure
-        report = {
-            "meta": {
-                "report_type": report_type,
-                "time_period": time_period,
-                "generated_date": current_date,
-                "data_sources": data_sources
-            },
-            "content": {}
-        }
-        
-        # Generate report sections based on requested sections
-        if "executive_summary" in include_sections:
-            report["content"]["executive_summary"] = self._generate_executive_summary(report_type, time_period)
-            
-        if "data_analysis" in include_sections:
-            report["content"]["data_analysis"] = self._generate_data_analysis(report_type, time_period)
-            
-        if "recommendations" in include_sections:
-            report["content"]["recommendations"] = self._generate_recommendations(report_type)
-            
-        if "competitive_landscape" in include_sections:
-            report["content"]["competitive_landscape"] = self._generate_competitive_landscape()
-            
-        if "future_outlook" in include_sections:
-            report["content"]["future_outlook"] = self._generate_future_outlook(report_type)
-        
-        # Format the report according to the requested format
-        if format.lower() == "markdown":
-            report["formatted_report"] = self._format_as_markdown(report)
-        elif format.lower() == "html":
-            report["formatted_report"] = self._format_as_html(report)
-        else:  # Default to JSON
-            report["formatted_report"] = json.dumps(report["content"], indent=2)
-            
-        return report
-    
-    def _generate_executive_summary(self, report_type: str, time_period: str) -> str:
-        """Generate an executive summary for the report."""
-        summaries = {
-            "market_overview": f"""
+# Turns snake_case identifiers into words for display
+_UNDERSCORE_TO_SPACE = str.maketrans("_", " ")
+
+# HTML report shell; the head is filled with str.format
+_HTML_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+    <title>{title} Report - {time_period}</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; line-height: 1.6; max-width: 800px; margin: 0 auto; padding: 20px; }}
+        h1, h2, h3 {{ color: #333; }}
+        table {{ border-collapse: collapse; width: 100%; margin-bottom: 20px; }}
+        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
+        th {{ background-color: #f2f2f2; }}
+    </style>
+</head>
+<body>
+    <h1>{title} Report</h1>
+    <h2>{time_period}</h2>
+    <p>Generated on: {generated_date}</p>
+"""
+_HTML_FOOT = "</body>\n</html>"
+
+# Report section templates, keyed by report type. {time_period} and
+# {report_type} are filled in with str.format; the rest is static text.
+_EXECUTIVE_SUMMARIES: Final[Dict[str, str]] = {
+    "market_overview": """
 ## Executive Summary
 
 During {time_period}, the market showed significant dynamism with several notable trends emerging. 
@@ -131,8 +58,8 @@ the strongest gains at 27% year-over-year growth.
 
 Key strategic implications include the need for enhanced mobile experiences, greater focus on 
 sustainability messaging, and investment in personalized customer journeys.
-            """,
-            "campaign_performance": f"""
+    """,
+    "campaign_performance": """
 ## Executive Summary
 
 Campaign performance analysis for {time_period} reveals strong ROI across major initiatives, 
@@ -142,8 +69,8 @@ contributing to a 17% lift in qualified leads.
 
 Areas for optimization include targeting efficiency for the B2B segment and creative 
 refresh for ongoing awareness campaigns.
-            """,
-            "competitor_analysis": f"""
+    """,
+    "competitor_analysis": """
 ## Executive Summary
 
 Competitive landscape analysis for {time_period} shows a slight market consolidation, 
@@ -153,19 +80,12 @@ Main competitor Alpha Inc. has increased their digital marketing spend by approx
 
 Emerging competitor Novex has shown the highest growth rate (28%), primarily through 
 aggressive pricing and rapid feature development.
-            """
-        }
-        
-        # Return the appropriate summary or a default one if the report type isn't recognized
-        return summaries.get(
-            report_type,
-            f"## Executive Summary\n\nThis report provides an analysis of {report_type} for {time_period}."
-        )
-    
-    def _generate_data_analysis(self, report_type: str, time_period: str) -> str:
-        """Generate data analysis content for the report."""
-        analyses = {
-            "market_overview": f"""
+    """
+}
+_EXECUTIVE_SUMMARY_DEFAULT: Final[str] = "## Executive Summary\n\nThis report provides an analysis of {report_type} for {time_period}."
+
+_DATA_ANALYSES: Final[Dict[str, str]] = {
+    "market_overview": """
 ## Data Analysis
 
 ### Market Size and Growth
@@ -189,8 +109,8 @@ year-over-year growth of 12.5%. This growth was primarily driven by:
 | Social Media | 22% | 2.8% | +1.2% |
 | Email | 12% | 5.7% | -0.2% |
 | Direct | 6% | 7.2% | -0.4% |
-            """,
-            "campaign_performance": f"""
+    """,
+    "campaign_performance": """
 ## Data Analysis
 
 ### Overall Campaign Performance
@@ -219,8 +139,8 @@ spend of $2.4M and attributed revenue of $14.8M, representing a blended ROI of 6
 | Email | 10% | 12.4x | $12 | 4.1% |
 | Content | 8% | 4.8x | $54 | N/A |
 | Affiliate | 7% | 9.1x | $28 | 1.4% |
-            """,
-            "competitor_analysis": f"""
+    """,
+    "competitor_analysis": """
 ## Data Analysis
 
 ### Market Share Analysis
@@ -249,19 +169,12 @@ Key competitors are positioned along the following dimensions:
 * **GammaTech** has launched two new product lines targeting enterprise customers
 * **Novex** is pursuing aggressive expansion through competitive pricing and rapid iteration
 * **DeltaSoft** is focusing on core customer base with enhanced service offerings
-            """
-        }
-        
-        # Return the appropriate analysis or a default one if the report type isn't recognized
-        return analyses.get(
-            report_type,
-            f"## Data Analysis\n\nDetailed analysis of {report_type} metrics for {time_period}."
-        )
-    
-    def _generate_recommendations(self, report_type: str) -> str:
-        """Generate recommendations for the report."""
-        recommendations = {
-            "market_overview": """
+    """
+}
+_DATA_ANALYSIS_DEFAULT: Final[str] = "## Data Analysis\n\nDetailed analysis of {report_type} metrics for {time_period}."
+
+_RECOMMENDATIONS: Final[Dict[str, str]] = {
+    "market_overview": """
 ## Strategic Recommendations
 
 ### Short-term Actions (Next Quarter)
@@ -285,8 +198,8 @@ Key competitors are positioned along the following dimensions:
    * Reallocate 15-20% of traditional media budget to high-performing digital channels
    * Develop integrated measurement framework for cross-channel attribution
    * Establish regular optimization routines based on performance data
-            """,
-            "campaign_performance": """
+    """,
+    "campaign_performance": """
 ## Strategic Recommendations
 
 ### Campaign Optimization Opportunities
@@ -310,8 +223,8 @@ Key competitors are positioned along the following dimensions:
    * Expand lookalike modeling based on high-value customer cohorts
    * Develop re-engagement campaigns for dormant customer segments
    * Create targeted content for emerging high-potential segments
-            """,
-            "competitor_analysis": """
+    """,
+    "competitor_analysis": """
 ## Strategic Recommendations
 
 ### Competitive Positioning Opportunities
@@ -335,18 +248,11 @@ Key competitors are positioned along the following dimensions:
    * Accelerate feature development in areas with competitive advantage potential
    * Enhance analytics capabilities to enable faster competitive response
    * Develop price optimization strategy to maintain margins while remaining competitive
-            """
-        }
-        
-        # Return the appropriate recommendations or default ones if the report type isn't recognized
-        return recommendations.get(
-            report_type,
-            "## Recommendations\n\nStrategic recommendations based on the analysis."
-        )
-    
-    def _generate_competitive_landscape(self) -> str:
-        """Generate competitive landscape analysis."""
-        return """
+    """
+}
+_RECOMMENDATIONS_DEFAULT: Final[str] = "## Recommendations\n\nStrategic recommendations based on the analysis."
+
+_COMPETITIVE_LANDSCAPE: Final[str] = """
 ## Competitive Landscape
 
 ### Major Competitors
@@ -370,12 +276,10 @@ product differentiation.
 | GammaTech | Medium | Enterprise relationships | Limited market scope |
 | Novex | High | Growth rate, Pricing | Product depth |
 | DeltaSoft | Low | Loyal base, Service quality | Declining share |
-        """
-    
-    def _generate_future_outlook(self, report_type: str) -> str:
-        """Generate future outlook for the report."""
-        outlooks = {
-            "market_overview": """
+"""
+
+_FUTURE_OUTLOOKS: Final[Dict[str, str]] = {
+    "market_overview": """
 ## Future Market Outlook
 
 ### 12-Month Forecast
@@ -398,8 +302,8 @@ product differentiation.
    * AR integration in product visualization
    * Interactive content driving longer engagement
    * Cross-channel continuity in customer experience
-            """,
-            "campaign_performance": """
+    """,
+    "campaign_performance": """
 ## Future Campaign Outlook
 
 ### Upcoming Campaign Opportunities
@@ -422,8 +326,8 @@ product differentiation.
    * Attribution models shifting to AI-driven approaches
    * Integration of online and offline data sources
    * Real-time optimization capabilities
-            """,
-            "competitor_analysis": """
+    """,
+    "competitor_analysis": """
 ## Future Competitive Outlook
 
 ### Projected Market Share Shifts
@@ -450,86 +354,351 @@ We forecast the following market share changes over the next 12 months:
    * Continued aggressive expansion and customer acquisition
    * Potential funding round to accelerate growth
    * Product expansion to challenge enterprise segment
-            """
+    """
+}
+_FUTURE_OUTLOOK_DEFAULT: Final[str] = "## Future Outlook\n\nProjections and forecast for upcoming periods."
+
+# Section generators
+# Sections are pure functions of their arguments. The two that interpolate
+# values are memoised; the rest return their static template directly.
+@functools.lru_cache(maxsize=64)
+def _executive_summary(report_type: str, time_period: str) -> str:
+    """Generate an executive summary for the report."""
+    # Return the appropriate summary or a default one if the report type isn't recognized
+    template = _EXECUTIVE_SUMMARIES.get(report_type, _EXECUTIVE_SUMMARY_DEFAULT)
+    return template.format(report_type=report_type, time_period=time_period)
+
+@functools.lru_cache(maxsize=64)
+def _data_analysis(report_type: str, time_period: str) -> str:
+    """Generate data analysis content for the report."""
+    # Return the appropriate analysis or a default one if the report type isn't recognized
+    template = _DATA_ANALYSES.get(report_type, _DATA_ANALYSIS_DEFAULT)
+    return template.format(report_type=report_type, time_period=time_period)
+
+def _recommendations(report_type: str) -> str:
+    """Generate recommendations for the report."""
+    # Return the appropriate recommendations or default ones if the report type isn't recognized
+    return _RECOMMENDATIONS.get(report_type, _RECOMMENDATIONS_DEFAULT)
+
+def _competitive_landscape() -> str:
+    """Generate competitive landscape analysis."""
+    return _COMPETITIVE_LANDSCAPE
+
+def _future_outlook(report_type: str) -> str:
+    """Generate future outlook for the report."""
+    # Return the appropriate outlook or a default one if the report type isn't recognized
+    return _FUTURE_OUTLOOKS.get(report_type, _FUTURE_OUTLOOK_DEFAULT)
+
+# Section name -> generator taking (report_type, time_period)
+_SECTION_DISPATCH: Dict[str, Callable[[str, str], str]] = {
+    "executive_summary": _executive_summary,
+    "data_analysis": _data_analysis,
+    "recommendations": lambda report_type, time_period: _recommendations(report_type),
+    "competitive_landscape": lambda report_type, time_period: _competitive_landscape(),
+    "future_outlook": lambda report_type, time_period: _future_outlook(report_type)
+}
+
+# Tool Input Schema
+class ReportGenerationInput(BaseModel):
+    """Input for report generation."""
+    report_type: str = Field(
+        ...,
+        description="Type of report to generate (e.g., 'market_overview', 'campaign_performance', 'competitor_analysis')"
+    )
+    time_period: str = Field(
+        ...,
+        description="Time period covered by the report (e.g., 'Q1 2023', 'last 6 months')"
+    )
+    include_sections: List[str] = Field(
+        default=["executive_summary", "data_analysis", "recommendations"],
+        description="Sections to include in the report"
+    )
+    format: str = Field(
+        default="markdown",
+        description="Format of the generated report (markdown, html, json)"
+    )
+    data_sources: Optional[List[str]] = Field(
+        default=None,
+        description="Specific data sources to include in the report"
+    )
+    include_structured: bool = Field(
+        default=True,
+        description="Whether to return each section's content alongside the formatted report"
+    )
+
+class BatchReportGenerationInput(BaseModel):
+    """Input for generating several reports in one call."""
+    reports: List[ReportGenerationInput] = Field(
+        ...,
+        description="One entry per report to generate, each taking the generate_marketing_report arguments"
+    )
+
+class ReportGenerationTool(BaseTool):
+    """Tool for generating marketing reports."""
+    name: str = "generate_marketing_report"
+    description: str = """
+    Generates comprehensive marketing reports based on analyzed data.
+    Use this tool when you need to create a structured report about market trends,
+    campaign performance, competitor analysis, or other marketing insights.
+    The report can include executive summaries, detailed data analysis, and recommendations.
+    """
+    args_schema: Type[BaseModel] = ReportGenerationInput
+    
+    def _run(
+        self, 
+        report_type: str, 
+        time_period: str, 
+        include_sections: List[str],
+        format: str = "markdown",
+        data_sources: Optional[List[str]] = None,
+        include_structured: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Generate a marketing report.
+        
+        Args:
+            report_type: Type of report to generate
+            time_period: Time period covered by the report
+            include_sections: Sections to include in the report
+            format: Format of the generated report
+            data_sources: Specific data sources to include
+            include_structured: Whether to return the per-section content
+            
+        Returns:
+            Dict[str, Any]: Generated report data
+        """
+        logger.info("Generating %s report for %s", report_type, time_period)
+        
+        # Get current date for the report
+        current_date = date.today().isoformat()
+        
+        return self._build_report(
+            report_type, time_period, include_sections, format, data_sources,
+            include_structured, current_date
+        )
+    
+    def _run_batch(self, requests: List[ReportGenerationInput]) -> List[Dict[str, Any]]:
+        """
+        Generate several marketing reports in one call.
+        
+        The report date is taken once, so every report in the batch carries
+        the same generated date.
+        
+        Args:
+            requests: Validated inputs, one per report
+            
+        Returns:
+            List[Dict[str, Any]]: Generated report data, in request order
+        """
+        logger.info("Generating a batch of %d reports", len(requests))
+        
+        current_date = date.today().isoformat()
+        return [
+            self._build_report(
+                request.report_type, request.time_period, request.include_sections,
+                request.format, request.data_sources, request.include_structured,
+                current_date
+            )
+            for request in requests
+        ]
+    
+    def _build_report(
+        self,
+        report_type: str,
+        time_period: str,
+        include_sections: List[str],
+        format: str,
+        data_sources: Optional[List[str]],
+        include_structured: bool,
+        current_date: str
+    ) -> Dict[str, Any]:
+        """
+        Build a single report.
+        
+        Args:
+            report_type: Type of report to generate
+            time_period: Time period covered by the report
+            include_sections: Sections to include in the report
+            format: Format of the generated report
+            data_sources: Specific data sources to include
+            include_structured: Whether to return the per-section content
+            current_date: Date the report is generated on
+            
+        Returns:
+            Dict[str, Any]: Generated report data
+        """
+        # This would typically compile data from various sources and generate a report
+        # For demonstration, we'll return a mock report
+        
+        # Template keys are interned literals, so an interned report type
+        # matches them by identity
+        report_type = sys.intern(report_type)
+        
+        if data_sources is None:
+            data_sources = ["internal_analytics", "market_research", "competitor_data"]
+        
+        # Initialize report structure
+        report = {
+            "meta": {
+                "report_type": report_type,
+                "time_period": time_period,
+                "generated_date": current_date,
+                "data_sources": data_sources,
+                # Display forms shared by the markdown and HTML formatters
+                "report_type_display": report_type.translate(_UNDERSCORE_TO_SPACE).title(),
+                "data_sources_display": [
+                    source.translate(_UNDERSCORE_TO_SPACE).title() for source in data_sources
+                ]
+            }
         }
+        content: Dict[str, str] = {}
+        if include_structured:
+            report["content"] = content
         
-        # Return the appropriate outlook or a default one if the report type isn't recognized
-        return outlooks.get(
-            report_type,
-            "## Future Outlook\n\nProjections and forecast for upcoming periods."
+        # Generate report sections lazily, so the formatters write each one out
+        # as soon as it is produced; sections are only kept if they are returned
+        sections = self._iter_sections(
+            report_type, time_period, include_sections, content if include_structured else None
         )
+        
+        # Format the report according to the requested format
+        formatter = self._formatter(format)
+        if formatter is not None:
+            buf = io.StringIO()
+            buf.writelines(formatter(report["meta"], sections))
+            report["formatted_report"] = buf.getvalue()
+        else:  # Default to JSON, which is built from every section by name
+            for _ in self._iter_sections(report_type, time_period, include_sections, content):
+                pass
+            report["formatted_report"] = orjson.dumps(content, option=orjson.OPT_INDENT_2).decode()
+            
+        return report
     
-    def _format_as_markdown(self, report: Dict[str, Any]) -> str:
-        """Format report as Markdown."""
-        content = report["content"]
-        meta = report["meta"]
+    def format_report_bytes(self, report: Dict[str, Any], format: str = "markdown") -> bytes:
+        """
+        Format a generated report as UTF-8 bytes.
+        
+        For callers that write the report straight to a file or socket: each
+        formatted chunk is encoded as it is produced, and JSON is returned as
+        orjson's bytes, so no intermediate str of the whole report is built.
         
-        md_content = f"""# {meta['report_type'].replace('_', ' ').title()} Report
+        Args:
+            report: Report returned by this tool, with its per-section content
+            format: Format of the output (markdown, html, json)
+            
+        Returns:
+            bytes: The formatted report, encoded as UTF-8
+            
+        Raises:
+            ValueError: If the report was generated with include_structured=False
+        """
+        content = report.get("content")
+        if content is None:
+            raise ValueError("Report has no section content; generate it with include_structured=True")
+        
+        formatter = self._formatter(format)
+        if formatter is None:  # Default to JSON
+            return orjson.dumps(content, option=orjson.OPT_INDENT_2)
+        return b"".join(chunk.encode() for chunk in formatter(report["meta"], content.values()))
+    
+    def _formatter(self, format: str) -> Optional[Callable[[Dict[str, Any], Iterable[str]], Iterator[str]]]:
+        """Get the text formatter for a report format, or None for JSON."""
+        fmt = format.lower()
+        if fmt == "markdown":
+            return self._format_as_markdown
+        if fmt == "html":
+            return self._format_as_html
+        return None
+    
+    def _iter_sections(
+        self,
+        report_type: str,
+        time_period: str,
+        include_sections: List[str],
+        content: Optional[Dict[str, str]]
+    ) -> Iterator[str]:
+        """
+        Generate the requested report sections one at a time.
+        
+        Args:
+            report_type: Type of report to generate
+            time_period: Time period covered by the report
+            include_sections: Sections to include in the report
+            content: Dictionary each generated section is recorded in, if any
+            
+        Yields:
+            str: Markdown content of each section
+        """
+        # Sections follow the requested order; unknown or repeated names are skipped
+        for name in dict.fromkeys(include_sections):
+            generate = _SECTION_DISPATCH.get(name)
+            if generate is not None:
+                section = generate(report_type, time_period)
+                if content is not None:
+                    content[name] = section
+                yield section
+    
+    def _format_as_markdown(self, meta: Dict[str, Any], sections: Iterable[str]) -> Iterator[str]:
+        """Format report as Markdown, emitting sections as they are generated."""
+        yield f"""# {meta['report_type_display']} Report
 ## {meta['time_period']}
 Generated on: {meta['generated_date']}
 
 """
         
         # Add each section to the markdown
-        for section_name, section_content in content.items():
-            md_content += section_content + "\n\n"
+        for section_content in sections:
+            yield section_content
+            yield "\n\n"
             
         # Add data sources
-        md_content += "## Data Sources\n"
-        for source in meta['data_sources']:
-            md_content += f"* {source.replace('_', ' ').title()}\n"
-            
-        return md_content
+        yield "## Data Sources\n"
+        for source in meta['data_sources_display']:
+            yield f"* {source}\n"
     
-    def _format_as_html(self, report: Dict[str, Any]) -> str:
-        """Format report as HTML."""
-        content = report["content"]
-        meta = report["meta"]
-        
-        # Convert markdown to basic HTML
-        # This is a simplified conversion for demonstration
-        html_content = f"""<!DOCTYPE html>
-<html>
-<head>
-    <title>{meta['report_type'].replace('_', ' ').title()} Report - {meta['time_period']}</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; line-height: 1.6; max-width: 800px; margin: 0 auto; padding: 20px; }}
-        h1, h2, h3 {{ color: #333; }}
-        table {{ border-collapse: collapse; width: 100%; margin-bottom: 20px; }}
-        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-        th {{ background-color: #f2f2f2; }}
-    </style>
-</head>
-<body>
-    <h1>{meta['report_type'].replace('_', ' ').title()} Report</h1>
-    <h2>{meta['time_period']}</h2>
-    <p>Generated on: {meta['generated_date']}</p>
-"""
+    def _format_as_html(self, meta: Dict[str, Any], sections: Iterable[str]) -> Iterator[str]:
+        """Format report as HTML, converting sections as they are generated."""
+        yield _HTML_HEAD.format(
+            title=meta['report_type_display'],
+            time_period=meta['time_period'],
+            generated_date=meta['generated_date']
+        )
         
         # Add each section to the HTML
-        for section_name, section_content in content.items():
-            # Very basic conversion of markdown headings to HTML
-            # In a real implementation, you would use a proper markdown to HTML converter
-            html_section = section_content.replace("# ", "<h1>").replace(" #", "</h1>")
-            html_section = html_section.replace("## ", "<h2>").replace(" ##", "</h2>")
-            html_section = html_section.replace("### ", "<h3>").replace(" ###", "</h3>")
-            
-            # Convert bullet points
-            html_section = html_section.replace("* ", "<li>").replace("\n* ", "</li>\n<li>")
-            if "<li>" in html_section:
-                html_section = "<ul>\n" + html_section + "</li>\n</ul>"
-                
-            # Convert numbered lists (simplistic approach)
-            for i in range(1, 10):
-                html_section = html_section.replace(f"{i}. ", f"<li>").replace(f"\n{i}. ", "</li>\n<li>")
-            
-            html_content += f"<div>{html_section}</div>"
+        for section_content in sections:
+            # Sections carry indentation from their source literals; strip it so
+            # trailing whitespace is not rendered as a code block
+            yield "<div>"
+            yield _MD(section_content.strip())
+            yield "</div>"
             
         # Add data sources
-        html_content += "<h2>Data Sources</h2>\n<ul>"
-        for source in meta['data_sources']:
-            html_content += f"<li>{source.replace('_', ' ').title()}</li>\n"
-        html_content += "</ul>"
+        yield "<h2>Data Sources</h2>\n<ul>"
+        for source in meta['data_sources_display']:
+            yield f"<li>{source}</li>\n"
+        yield "</ul>"
+        
+        yield _HTML_FOOT
+
+class BatchReportGenerationTool(ReportGenerationTool):
+    """Tool for generating several marketing reports in one call."""
+    name: str = "generate_marketing_reports"
+    description: str = """
+    Generates several marketing reports in one call, for example the same report
+    over different time periods or with different sections.
+    Use this tool instead of calling generate_marketing_report repeatedly.
+    Each entry in reports takes the same arguments as generate_marketing_report.
+    """
+    args_schema: Type[BaseModel] = BatchReportGenerationInput
+    
+    def _run(self, reports: List[ReportGenerationInput]) -> List[Dict[str, Any]]:
+        """
+        Generate a batch of marketing reports.
         
-        html_content += "</body>\n</html>"
-        return html_content 
\ No newline at end of file
+        Args:
+            reports: Validated inputs, one per report
+            
+        Returns:
+            List[Dict[str, Any]]: Generated report data, in request order
+        """
+        return self._run_batch(reports)
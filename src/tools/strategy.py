@@ -5,14 +5,487 @@ This module provides tools for generating strategic marketing recommendations
 based on analyzed data and insights.
 """
 
-from typing import Dict, List, Any, Optional, Type
+from types import MappingProxyType
+from typing import Callable, Dict, FrozenSet, List, Any, Mapping, Optional, Set, Tuple, Type
+from dataclasses import asdict, dataclass
+import functools
 import logging
+import re
+import string
+import sys
+import numpy as np
+import orjson
 from pydantic import BaseModel, Field
 from langchain.tools import BaseTool, tool
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Lowercases ASCII letters and turns spaces into underscores in one pass
+_NORMALIZE = str.maketrans(string.ascii_uppercase + " ", string.ascii_lowercase + "_")
+
+# Strategy templates for each business objective; suitable_for and
+# time_horizon are only used for matching and are not returned
+_STRATEGY_TEMPLATES: Mapping[str, Tuple[Mapping[str, Any], ...]] = MappingProxyType({
+    "increase_market_share": (
+        MappingProxyType({
+            "strategy": "Competitive Pricing Strategy",
+            "description": "Implement competitive pricing to attract customers from competitors.",
+            "tactics": (
+                "Conduct comprehensive pricing analysis",
+                "Identify price elasticity in target segments",
+                "Develop tiered pricing options",
+                "Implement strategic discounting for new customers"
+            ),
+            "suitable_for": frozenset({"price_sensitive", "b2c", "retail", "e_commerce"}),
+            "time_horizon": frozenset({"short_term", "medium_term"})
+        }),
+        MappingProxyType({
+            "strategy": "Product Differentiation",
+            "description": "Enhance product features to stand out from competitors.",
+            "tactics": (
+                "Conduct feature gap analysis against competitors",
+                "Prioritize development of unique selling points",
+                "Enhance product positioning",
+                "Develop compelling messaging around differentiators"
+            ),
+            "suitable_for": frozenset({"premium", "b2b", "tech", "saas"}),
+            "time_horizon": frozenset({"medium_term", "long_term"})
+        }),
+        MappingProxyType({
+            "strategy": "Market Expansion",
+            "description": "Enter new geographic or demographic markets.",
+            "tactics": (
+                "Identify high-potential market segments",
+                "Develop market entry strategy",
+                "Adapt product/messaging for new markets",
+                "Build channel partnerships in new regions"
+            ),
+            "suitable_for": frozenset({"established", "b2b", "b2c", "global"}),
+            "time_horizon": frozenset({"medium_term", "long_term"})
+        }),
+        MappingProxyType({
+            "strategy": "Digital Channel Optimization",
+            "description": "Enhance digital marketing to increase reach and acquisition.",
+            "tactics": (
+                "Audit current digital channel performance",
+                "Reallocate budget to high-performing channels",
+                "Implement advanced targeting capabilities",
+                "Develop content strategy for organic growth"
+            ),
+            "suitable_for": frozenset({"digital_native", "e_commerce", "b2c", "d2c"}),
+            "time_horizon": frozenset({"short_term", "medium_term"})
+        })
+    ),
+    "improve_customer_retention": (
+        MappingProxyType({
+            "strategy": "Customer Loyalty Program",
+            "description": "Implement or enhance loyalty program to increase retention.",
+            "tactics": (
+                "Design tiered reward structure",
+                "Implement personalized loyalty benefits",
+                "Develop exclusive content/features for loyal customers",
+                "Create community elements for customer engagement"
+            ),
+            "suitable_for": frozenset({"retail", "b2c", "subscription", "service"}),
+            "time_horizon": frozenset({"short_term", "medium_term"})
+        }),
+        MappingProxyType({
+            "strategy": "Customer Experience Enhancement",
+            "description": "Improve customer experience across touchpoints.",
+            "tactics": (
+                "Map customer journey and identify friction points",
+                "Implement customer feedback loops",
+                "Enhance customer support capabilities",
+                "Develop proactive engagement strategies"
+            ),
+            "suitable_for": frozenset({"b2b", "b2c", "service", "subscription"}),
+            "time_horizon": frozenset({"medium_term", "long_term"})
+        }),
+        MappingProxyType({
+            "strategy": "Value-Added Services",
+            "description": "Develop complementary services to increase customer value.",
+            "tactics": (
+                "Identify high-value service opportunities",
+                "Develop bundling strategies",
+                "Create educational content and resources",
+                "Implement success management for key accounts"
+            ),
+            "suitable_for": frozenset({"b2b", "saas", "premium", "service"}),
+            "time_horizon": frozenset({"medium_term", "long_term"})
+        }),
+        MappingProxyType({
+            "strategy": "Personalization Strategy",
+            "description": "Implement data-driven personalization across customer interactions.",
+            "tactics": (
+                "Enhance customer data collection and integration",
+                "Develop personalized content strategy",
+                "Implement behavioral triggers for engagement",
+                "Create personalized product recommendations"
+            ),
+            "suitable_for": frozenset({"e_commerce", "b2c", "retail", "subscription"}),
+            "time_horizon": frozenset({"short_term", "medium_term"})
+        })
+    ),
+    "launch_new_product": (
+        MappingProxyType({
+            "strategy": "Market Penetration Strategy",
+            "description": "Aggressive entry to quickly gain market share.",
+            "tactics": (
+                "Competitive pricing strategy",
+                "High-visibility promotional campaign",
+                "Strategic partnerships for distribution",
+                "Early adopter incentive program"
+            ),
+            "suitable_for": frozenset({"b2c", "tech", "startup", "consumer_goods"}),
+            "time_horizon": frozenset({"short_term"})
+        }),
+        MappingProxyType({
+            "strategy": "Thought Leadership Campaign",
+            "description": "Establish category leadership through expertise.",
+            "tactics": (
+                "Develop educational content series",
+                "Secure speaking opportunities at industry events",
+                "Publish original research/white papers",
+                "Build relationships with industry influencers"
+            ),
+            "suitable_for": frozenset({"b2b", "saas", "professional_services", "tech"}),
+            "time_horizon": frozenset({"medium_term", "long_term"})
+        }),
+        MappingProxyType({
+            "strategy": "Phased Rollout Strategy",
+            "description": "Controlled launch across segments to optimize product.",
+            "tactics": (
+                "Identify beta testing customer segments",
+                "Develop feedback collection mechanisms",
+                "Create rapid iteration processes",
+                "Plan phase-based expansion roadmap"
+            ),
+            "suitable_for": frozenset({"b2b", "tech", "saas", "complex_products"}),
+            "time_horizon": frozenset({"medium_term"})
+        }),
+        MappingProxyType({
+            "strategy": "Integrated Launch Campaign",
+            "description": "Coordinated multi-channel campaign for maximum impact.",
+            "tactics": (
+                "Develop unified messaging strategy",
+                "Create coordinated content across channels",
+                "Plan sequential reveal strategy",
+                "Implement measurement framework for optimization"
+            ),
+            "suitable_for": frozenset({"b2c", "consumer_goods", "retail", "e_commerce"}),
+            "time_horizon": frozenset({"short_term", "medium_term"})
+        })
+    ),
+    "increase_brand_awareness": (
+        MappingProxyType({
+            "strategy": "Content Marketing Strategy",
+            "description": "Build awareness through valuable content.",
+            "tactics": (
+                "Develop content pillars aligned with audience interests",
+                "Create multi-format content strategy",
+                "Implement SEO optimization for discoverability",
+                "Establish content distribution partnerships"
+            ),
+            "suitable_for": frozenset({"b2b", "b2c", "service", "thought_leadership"}),
+            "time_horizon": frozenset({"medium_term", "long_term"})
+        }),
+        MappingProxyType({
+            "strategy": "Influencer Partnership Program",
+            "description": "Leverage influencers to expand brand reach.",
+            "tactics": (
+                "Identify relevant influencers across tiers",
+                "Develop authentic partnership frameworks",
+                "Create co-branded content opportunities",
+                "Implement performance-based compensation models"
+            ),
+            "suitable_for": frozenset({"b2c", "consumer_goods", "lifestyle", "e_commerce"}),
+            "time_horizon": frozenset({"short_term", "medium_term"})
+        }),
+        MappingProxyType({
+            "strategy": "Community Building Initiative",
+            "description": "Create engaged community around brand values.",
+            "tactics": (
+                "Develop community platform strategy",
+                "Create valuable engagement opportunities",
+                "Implement user-generated content program",
+                "Establish ambassador program for advocates"
+            ),
+            "suitable_for": frozenset({"b2c", "lifestyle", "value_driven", "subscription"}),
+            "time_horizon": frozenset({"medium_term", "long_term"})
+        }),
+        MappingProxyType({
+            "strategy": "Strategic PR Campaign",
+            "description": "Generate earned media coverage for brand.",
+            "tactics": (
+                "Develop newsworthy storylines",
+                "Build relationships with key media outlets",
+                "Create press kit and supporting materials",
+                "Plan staged announcement strategy"
+            ),
+            "suitable_for": frozenset({"b2b", "b2c", "launch", "corporate"}),
+            "time_horizon": frozenset({"short_term", "medium_term"})
+        })
+    )
+})
+
+# Objective used when the requested one has no templates
+_DEFAULT_OBJECTIVE = "increase_market_share"
+
+# Segments that indicate the caller named a specific market; without any of
+# them every strategy for the time horizon is considered suitable
+_GENERIC_SEGMENTS = frozenset({"b2b", "b2c", "retail", "tech"})
+
+def _build_index(field: str) -> Mapping[str, Mapping[str, FrozenSet[int]]]:
+    """
+    Build an inverted index over one matching field of the strategy templates.
+    
+    Args:
+        field: Template field to index ("suitable_for" or "time_horizon")
+        
+    Returns:
+        Mapping[str, Mapping[str, FrozenSet[int]]]: Template indices by objective and field value
+    """
+    index = {}
+    for objective, templates in _STRATEGY_TEMPLATES.items():
+        by_value: Dict[str, Set[int]] = {}
+        for i, template in enumerate(templates):
+            for value in template[field]:
+                by_value.setdefault(value, set()).add(i)
+        index[objective] = MappingProxyType({value: frozenset(ids) for value, ids in by_value.items()})
+    return MappingProxyType(index)
+
+# Templates without the matching metadata, as returned to callers. These are
+# shared by every result and only leave the module through _run's copy; the
+# strings are interned so every copy refers to the same objects
+_PUBLIC_STRATEGIES: Mapping[str, Tuple[Dict[str, Any], ...]] = MappingProxyType({
+    objective: tuple(
+        {
+            "strategy": sys.intern(template["strategy"]),
+            "description": sys.intern(template["description"]),
+            "tactics": list(map(sys.intern, template["tactics"]))
+        }
+        for template in templates
+    )
+    for objective, templates in _STRATEGY_TEMPLATES.items()
+})
+
+# Implementation plan milestone names for each strategy, one per tactic
+_MILESTONE_NAMES: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    template["strategy"]: tuple(sys.intern(f"Complete {tactic}") for tactic in template["tactics"])
+    for templates in _STRATEGY_TEMPLATES.values()
+    for template in templates
+})
+
+# Dependencies of the j-th milestone of a phase; shared like _PUBLIC_STRATEGIES
+_MILESTONE_DEPENDENCIES: Tuple[List[str], ...] = ([],) + tuple(
+    [f"Milestone {j}"]
+    for j in range(1, max(map(len, _MILESTONE_NAMES.values())))
+)
+
+@functools.lru_cache(maxsize=None)
+def _milestone_offsets(n_tactics: int, span: int) -> Tuple[int, ...]:
+    """
+    Spread a phase's milestones evenly over its span.
+    
+    Args:
+        n_tactics: Number of tactics (milestones) in the phase
+        span: Length of the phase
+        
+    Returns:
+        Tuple[int, ...]: Offset of each milestone from the start of the phase
+    """
+    return tuple((j * span) // (n_tactics + 1) for j in range(n_tactics))
+
+# Template indices by objective and suitable segment / time horizon
+_SEGMENT_INDEX = _build_index("suitable_for")
+_TIME_HORIZON_INDEX = _build_index("time_horizon")
+
+# Longest suitable segment, in underscore-separated tokens (e.g. "e_commerce")
+_MAX_SEGMENT_TOKENS = max(
+    segment.count("_") + 1
+    for segments in _SEGMENT_INDEX.values()
+    for segment in segments
+)
+
+def _segment_terms(market_segment: str) -> FrozenSet[str]:
+    """
+    Split a normalized market segment into the terms it can be matched on.
+    
+    Args:
+        market_segment: Normalized market segment (e.g. "b2c_e_commerce")
+        
+    Returns:
+        FrozenSet[str]: Every run of up to _MAX_SEGMENT_TOKENS consecutive tokens
+    """
+    tokens = market_segment.split("_")
+    return frozenset(
+        "_".join(tokens[i:j])
+        for i in range(len(tokens))
+        for j in range(i + 1, min(len(tokens), i + _MAX_SEGMENT_TOKENS) + 1)
+    )
+
+def _budget_weights(n: int) -> Tuple[int, ...]:
+    """
+    Compute the budget share of each of n recommended strategies.
+    
+    Args:
+        n: Number of recommended strategies
+        
+    Returns:
+        Tuple[int, ...]: Whole-percent share of each strategy, in order
+    """
+    # Give higher weight to first strategy, decreasing by 15% for each
+    # subsequent strategy down to a minimum weight of 30%
+    weights = np.maximum(0.3, 1.0 - np.arange(n) * 0.15)
+    return tuple(int(round(w * 100)) for w in (weights / weights.sum()).tolist())
+
+# Budget share by number of strategies, up to the most any objective returns
+_BUDGET_WEIGHTS: Mapping[int, Tuple[int, ...]] = MappingProxyType({
+    n: _budget_weights(n)
+    for n in range(1, max(map(len, _STRATEGY_TEMPLATES.values())) + 1)
+})
+
+# Standard budget allocation categories
+_BUDGET_CATEGORIES = (
+    "Media & Advertising",
+    "Content Production",
+    "Technology & Tools",
+    "Research & Analysis",
+    "Personnel & Resources"
+)
+
+# Category weights by strategy type (rows), in _BUDGET_CATEGORIES order
+_CAMPAIGN_TYPE, _CONTENT_TYPE, _PRODUCT_TYPE, _LOYALTY_TYPE, _DEFAULT_TYPE = range(5)
+_CATEGORY_WEIGHTS = np.array([
+    [40, 25, 15, 10, 10],  # Digital / Campaign
+    [20, 45, 10, 10, 15],  # Content
+    [15, 20, 25, 20, 20],  # Product
+    [10, 15, 35, 15, 25],  # Loyalty / Experience
+    [25, 20, 20, 15, 20]   # Default allocation
+])
+_CATEGORY_WEIGHTS.setflags(write=False)
+
+# Strategy-name keywords for each type, in priority order. Each group is an
+# empty capture behind a lookahead tried at the start of the name, so the
+# first type with a keyword anywhere in the name wins; group n is row n - 1
+_STRATEGY_TYPE_RE = re.compile(
+    r"(?=.*?(?:Digital|Campaign))()"
+    r"|(?=.*?Content)()"
+    r"|(?=.*?Product)()"
+    r"|(?=.*?(?:Loyalty|Experience))()"
+)
+
+def _strategy_type(strategy_name: str) -> int:
+    """Classify a strategy by name into a row of _CATEGORY_WEIGHTS."""
+    # Different strategies have different category weights
+    match = _STRATEGY_TYPE_RE.match(strategy_name)
+    return match.lastindex - 1 if match else _DEFAULT_TYPE
+
+# Common risks based on strategy types
+_COMMON_RISKS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "Competitive Pricing Strategy": (
+        "Potential margin erosion",
+        "Competitive retaliation",
+        "Price war escalation"
+    ),
+    "Product Differentiation": (
+        "Feature development delays",
+        "Insufficient differentiation",
+        "High development costs"
+    ),
+    "Market Expansion": (
+        "Cultural/regional adaptation challenges",
+        "Regulatory compliance issues",
+        "Resource dispersion"
+    ),
+    "Digital Channel Optimization": (
+        "Rising acquisition costs",
+        "Algorithm changes affecting performance",
+        "Technical implementation challenges"
+    ),
+    "Customer Loyalty Program": (
+        "Low adoption rates",
+        "Reward cost management",
+        "Program complexity"
+    ),
+    "Market Penetration Strategy": (
+        "Higher than expected acquisition costs",
+        "Slower than projected adoption",
+        "Supply chain constraints"
+    ),
+    "Content Marketing Strategy": (
+        "Content production resource constraints",
+        "Difficulty measuring direct ROI",
+        "Audience building timeline"
+    )
+})
+
+# Mitigation strategies by risk keyword, in priority order
+_MITIGATION_RULES: Tuple[Tuple[FrozenSet[str], str], ...] = (
+    (frozenset({"pricing", "margin"}), "Implement value-based pricing strategy with tiered options to protect margins"),
+    (frozenset({"competitive", "retaliation"}), "Develop scenario planning for competitive responses; prepare contingency plans"),
+    (frozenset({"delay", "timeline"}), "Implement agile methodology with regular milestones and flexible resource allocation"),
+    (frozenset({"cost", "budget"}), "Establish clear budget thresholds with stage-gate approach; prioritize initiatives by ROI"),
+    (frozenset({"adoption", "engagement"}), "Develop staged rollout with feedback loops; create targeted incentives for early adoption"),
+    (frozenset({"measurement", "roi"}), "Implement comprehensive attribution model; establish proxy metrics for long-term initiatives"),
+    (frozenset({"resource"}), "Create flexible resourcing plan with external partner options; prioritize initiatives")
+)
+_MITIGATION_TEXT = tuple(text for _, text in _MITIGATION_RULES)
+_DEFAULT_MITIGATION = "Establish monitoring system with early warning indicators; create contingency plans"
+
+# One lookahead per rule, tried in order at the start of the risk, so the
+# first rule with a keyword anywhere in the risk wins
+_MITIGATION_RE = re.compile(
+    "|".join(
+        f"(?=.*?(?:{'|'.join(map(re.escape, sorted(keywords)))}))(?P<g{i}>)"
+        for i, (keywords, _) in enumerate(_MITIGATION_RULES)
+    ),
+    re.DOTALL
+)
+
+# Primary and secondary metrics by business objective
+_METRICS_BY_OBJECTIVE: Mapping[str, Mapping[str, Tuple[str, ...]]] = MappingProxyType({
+    "increase_market_share": MappingProxyType({
+        "primary": ("Market share percentage", "New customer acquisition", "Competitive win rate"),
+        "secondary": ("Share of voice", "Brand consideration", "Product adoption rate")
+    }),
+    "improve_customer_retention": MappingProxyType({
+        "primary": ("Customer retention rate", "Churn rate", "Customer lifetime value"),
+        "secondary": ("Net promoter score", "Repeat purchase rate", "Account expansion rate")
+    }),
+    "launch_new_product": MappingProxyType({
+        "primary": ("Product adoption rate", "Revenue from new product", "Market penetration"),
+        "secondary": ("Product awareness", "Feature usage", "Cross-sell rate")
+    }),
+    "increase_brand_awareness": MappingProxyType({
+        "primary": ("Brand awareness", "Share of voice", "Brand search volume"),
+        "secondary": ("Social media engagement", "Press mentions", "Website traffic")
+    })
+})
+
+# Estimated impact ranges by business objective and impact level
+_IMPACT_RANGES: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    "increase_market_share": MappingProxyType({"low": "5-8%", "medium": "8-15%", "high": "15-25%"}),
+    "improve_customer_retention": MappingProxyType({"low": "10-15%", "medium": "15-25%", "high": "25-40%"}),
+    "launch_new_product": MappingProxyType({"low": "2-5%", "medium": "5-10%", "high": "10-20%"}),
+    "increase_brand_awareness": MappingProxyType({"low": "20-30%", "medium": "30-50%", "high": "50-100%"})
+})
+
+# Impact ranges for objectives without their own
+_DEFAULT_IMPACT_RANGES: Mapping[str, str] = MappingProxyType({"low": "5-10%", "medium": "10-20%", "high": "20-30%"})
+
+# Expected timeline to results by business objective
+_TIMELINES: Mapping[str, str] = MappingProxyType({
+    "increase_market_share": "3-6 months for initial results, 6-12 months for full impact",
+    "improve_customer_retention": "1-3 months for initial results, 6-9 months for full impact",
+    "launch_new_product": "1-2 months for initial traction, 3-6 months for significant adoption",
+    "increase_brand_awareness": "2-3 months for initial lift, 6-12 months for significant awareness increase"
+})
+
+# Timeline for objectives without their own
+_DEFAULT_TIMELINE = "3-6 months for initial results, 6-12 months for full impact"
+
 # Tool Input Schema
 class StrategyRecommendationInput(BaseModel):
     """Input for strategy recommendation."""
@@ -37,6 +510,300 @@ class StrategyRecommendationInput(BaseModel):
         description="List of current challenges or obstacles facing the business"
     )
 
+# Tool Result
+@dataclass(frozen=True)
+class StrategyRecommendation:
+    """Strategy recommendations for one set of normalized inputs."""
+    __slots__ = (
+        "business_objective",
+        "market_segment",
+        "time_horizon",
+        "available_budget",
+        "recommended_strategies",
+        "implementation_plan",
+        "expected_outcomes",
+        "risk_assessment",
+        "budget_allocation"
+    )
+    business_objective: str
+    market_segment: str
+    time_horizon: str
+    available_budget: Optional[str]
+    recommended_strategies: List[Dict[str, Any]]
+    implementation_plan: Dict[str, Any]
+    expected_outcomes: Dict[str, Any]
+    risk_assessment: Dict[str, Any]
+    budget_allocation: Optional[Dict[str, Any]]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the recommendations to the tool's dictionary output.
+        
+        Returns:
+            Dict[str, Any]: A deep copy of the recommendations, with
+                            budget_allocation only when a budget was given
+        """
+        result = asdict(self)
+        if result["budget_allocation"] is None:
+            del result["budget_allocation"]
+        return result
+
+# Recommendation generators
+#
+# Recommendations are pure functions of their (normalized) inputs, so results
+# are memoised. The cache holds each result with its serialized JSON, and every
+# call decodes its own copy, so callers are free to mutate what they get back.
+def _filter_strategies(
+    all_strategies: Tuple[Dict[str, Any], ...],
+    segment_index: Mapping[str, FrozenSet[int]],
+    time_horizon_index: Mapping[str, FrozenSet[int]],
+    market_segment: str,
+    time_horizon: str
+) -> List[Dict[str, Any]]:
+    """Get the strategies of one objective suitable for the market segment and time horizon."""
+    # Filter strategies based on market segment and time horizon
+    # This is a simplified matching - in a real system this would be more sophisticated
+    matched = time_horizon_index.get(time_horizon, frozenset())
+    segment_terms = _segment_terms(market_segment)
+
+    # Keep only segment matches, unless we couldn't determine a segment
+    if segment_terms & _GENERIC_SEGMENTS:
+        matched = matched & frozenset().union(*(segment_index.get(term, ()) for term in segment_terms))
+
+    filtered_strategies = [all_strategies[i] for i in sorted(matched)]
+
+    # If no strategies match, return at least 2 generic ones
+    if not filtered_strategies:
+        filtered_strategies = list(all_strategies[:2])
+
+    return filtered_strategies
+
+def _generate_implementation_plan(strategies: List[Dict[str, Any]], time_horizon: str) -> Dict[str, Any]:
+    """Generate an implementation plan for the recommended strategies."""
+    # Set timeline based on time horizon
+    if time_horizon == "short_term":
+        timeline_unit = "weeks"
+        total_duration = 12  # 12 weeks
+    elif time_horizon == "medium_term":
+        timeline_unit = "months"
+        total_duration = 12  # 12 months
+    else:  # long_term
+        timeline_unit = "quarters"
+        total_duration = 8  # 8 quarters
+
+    plan = {
+        "timeline_unit": timeline_unit,
+        "total_duration": total_duration,
+        "phases": []
+    }
+
+    # Create implementation phases
+    if len(strategies) > 0:
+        # Divide the total duration among strategies with some overlap
+        phase_duration = max(2, total_duration // len(strategies) + 1)
+
+        for i, strategy in enumerate(strategies):
+            start_time = max(0, i * phase_duration - 1)
+            end_time = min(total_duration, start_time + phase_duration)
+
+            # Generate milestones based on tactics
+            names = _MILESTONE_NAMES[strategy["strategy"]]
+            offsets = _milestone_offsets(len(names), end_time - start_time)
+            phase = {
+                "phase": f"Phase {i+1}: {strategy['strategy']}",
+                "start": start_time,
+                "end": end_time,
+                "key_milestones": [
+                    {
+                        "milestone": name,
+                        "timeline": start_time + offset,
+                        "dependencies": _MILESTONE_DEPENDENCIES[j]
+                    }
+                    for j, (name, offset) in enumerate(zip(names, offsets))
+                ]
+            }
+
+            plan["phases"].append(phase)
+
+    return plan
+
+def _generate_expected_outcomes(
+    metrics: Mapping[str, Tuple[str, ...]],
+    impact_ranges: Mapping[str, str],
+    timeline_to_results: str,
+    strategies: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Generate expected outcomes for the recommended strategies of one objective."""
+    outcomes = {
+        "primary_metrics": list(metrics["primary"]),
+        "secondary_metrics": list(metrics["secondary"]),
+        "estimated_impact": {}
+    }
+
+    # Determine impact level based on number and types of strategies
+    impact_level = "medium"
+    if len(strategies) >= 3:
+        impact_level = "high"
+    elif len(strategies) <= 1:
+        impact_level = "low"
+
+    # Get impact range for the business objective
+    impact_range = impact_ranges[impact_level]
+
+    # Generate impact statements
+    outcomes["estimated_impact"] = {
+        "overall_impact": f"Expected {impact_level} impact with {impact_range} improvement in primary metrics",
+        "timeline_to_results": timeline_to_results,
+        "key_performance_indicators": outcomes["primary_metrics"][:2],
+        "success_criteria": f"Achieve minimum {impact_range.split('-')[0]}% improvement in primary metrics"
+    }
+
+    return outcomes
+
+def _generate_risk_assessment(strategies: List[Dict[str, Any]], current_challenges: Tuple[str, ...]) -> Dict[str, Any]:
+    """Generate risk assessment for the recommended strategies."""
+    risk_assessment = {
+        "key_risks": [],
+        "mitigation_strategies": {}
+    }
+
+    # Generate key risks based on strategy types and current challenges
+    for strategy in strategies:
+        strategy_name = strategy["strategy"]
+
+        # Add common risks for this strategy type
+        if strategy_name in _COMMON_RISKS:
+            for risk in _COMMON_RISKS[strategy_name]:
+                if risk not in risk_assessment["key_risks"]:
+                    risk_assessment["key_risks"].append(risk)
+
+    # Add risks based on current challenges
+    for challenge in current_challenges:
+        challenge_risk = f"Existing challenge: {challenge}"
+        if challenge_risk not in risk_assessment["key_risks"]:
+            risk_assessment["key_risks"].append(challenge_risk)
+
+    # Limit to top 5 risks
+    risk_assessment["key_risks"] = risk_assessment["key_risks"][:5]
+
+    # Generate mitigation strategies for each risk
+    for risk in risk_assessment["key_risks"]:
+        # Common mitigation patterns
+        match = _MITIGATION_RE.match(risk.lower())
+        if match:
+            risk_assessment["mitigation_strategies"][risk] = _MITIGATION_TEXT[int(match.lastgroup[1:])]
+        else:
+            risk_assessment["mitigation_strategies"][risk] = _DEFAULT_MITIGATION
+
+    return risk_assessment
+
+@functools.lru_cache(maxsize=128)
+def _category_percentages(strategy_names: Tuple[str, ...]) -> Tuple[int, ...]:
+    """
+    Split a budget across the standard categories for a set of strategies.
+    
+    Args:
+        strategy_names: Names of the recommended strategies (at least one)
+        
+    Returns:
+        Tuple[int, ...]: Whole-percent share of each of _BUDGET_CATEGORIES
+    """
+    # Count strategies per type and weight the counts, rather than
+    # gathering one weight row per strategy
+    type_rows = np.fromiter(map(_strategy_type, strategy_names), dtype=np.intp, count=len(strategy_names))
+    totals = np.bincount(type_rows, minlength=len(_CATEGORY_WEIGHTS)) @ _CATEGORY_WEIGHTS
+
+    # Normalize category allocations
+    return tuple(np.round(totals / totals.sum() * 100).astype(int).tolist())
+
+def _generate_budget_allocation(strategies: List[Dict[str, Any]], available_budget: str) -> Dict[str, Any]:
+    """Generate budget allocation for the recommended strategies."""
+    budget_allocation = {
+        "budget_level": available_budget,
+        "allocation_by_strategy": {},
+        "allocation_by_category": {}
+    }
+
+    # Allocate budget by strategy
+    if strategies:
+        for strategy, allocation_pct in zip(strategies, _BUDGET_WEIGHTS[len(strategies)]):
+            budget_allocation["allocation_by_strategy"][strategy["strategy"]] = f"{allocation_pct}%"
+
+    # Allocate by category based on strategy types
+    if strategies:
+        percentages = _category_percentages(tuple(strategy["strategy"] for strategy in strategies))
+        budget_allocation["allocation_by_category"] = {
+            category: f"{pct}%" for category, pct in zip(_BUDGET_CATEGORIES, percentages)
+        }
+
+    return budget_allocation
+
+# Builds the recommendation for one objective from the normalized inputs
+_ObjectiveHandler = Callable[[str, str, str, Optional[str], Tuple[str, ...]], StrategyRecommendation]
+
+def _make_objective_handler(objective: str) -> _ObjectiveHandler:
+    """
+    Specialize recommendation building for one business objective.
+    
+    Args:
+        objective: Business objective with strategy templates
+        
+    Returns:
+        _ObjectiveHandler: Builder bound to the objective's templates, indexes,
+                           metrics, impact ranges and timeline
+    """
+    all_strategies = _PUBLIC_STRATEGIES[objective]
+    segment_index = _SEGMENT_INDEX[objective]
+    time_horizon_index = _TIME_HORIZON_INDEX[objective]
+    metrics = _METRICS_BY_OBJECTIVE[objective]
+    impact_ranges = _IMPACT_RANGES.get(objective, _DEFAULT_IMPACT_RANGES)
+    timeline_to_results = _TIMELINES.get(objective, _DEFAULT_TIMELINE)
+
+    def handler(
+        business_objective: str,
+        market_segment: str,
+        time_horizon: str,
+        available_budget: Optional[str],
+        current_challenges: Tuple[str, ...]
+    ) -> StrategyRecommendation:
+        # This would typically involve sophisticated analysis
+        # For demonstration, we'll return predefined strategies based on inputs
+        strategies = _filter_strategies(all_strategies, segment_index, time_horizon_index, market_segment, time_horizon)
+
+        return StrategyRecommendation(
+            business_objective=business_objective,
+            market_segment=market_segment,
+            time_horizon=time_horizon,
+            available_budget=available_budget,
+            recommended_strategies=strategies,
+            implementation_plan=_generate_implementation_plan(strategies, time_horizon),
+            expected_outcomes=_generate_expected_outcomes(metrics, impact_ranges, timeline_to_results, strategies),
+            risk_assessment=_generate_risk_assessment(strategies, current_challenges),
+            # Generate budget allocation if budget is provided
+            budget_allocation=_generate_budget_allocation(strategies, available_budget) if available_budget else None
+        )
+
+    return handler
+
+# Recommendation builder for each business objective with templates
+_OBJECTIVE_DISPATCH: Mapping[str, _ObjectiveHandler] = MappingProxyType({
+    objective: _make_objective_handler(objective) for objective in _STRATEGY_TEMPLATES
+})
+
+@functools.lru_cache(maxsize=256)
+def _compute_recommendation(
+    business_objective: str,
+    market_segment: str,
+    time_horizon: str,
+    available_budget: Optional[str],
+    current_challenges: Tuple[str, ...]
+) -> Tuple[StrategyRecommendation, bytes]:
+    """Build strategy recommendations for normalized inputs, with their serialized dictionary."""
+    # Default objective if not found
+    handler = _OBJECTIVE_DISPATCH.get(business_objective) or _OBJECTIVE_DISPATCH[_DEFAULT_OBJECTIVE]
+    recommendation = handler(business_objective, market_segment, time_horizon, available_budget, current_challenges)
+    return recommendation, orjson.dumps(recommendation.to_dict())
+
 class StrategyRecommendationTool(BaseTool):
     """Tool for generating strategic marketing recommendations."""
     name: str = "recommend_marketing_strategy"
@@ -68,599 +835,23 @@ class StrategyRecommendationTool(BaseTool):
         Returns:
             Dict[str, Any]: Strategy recommendations
         """
-        logger.info(f"Generating strategy recommendations for {business_objective} in {market_segment} segment")
+        logger.info("Generating strategy recommendations for %s in %s segment", business_objective, market_segment)
         
         # Handle default values
         if current_challenges is None:
             current_challenges = []
             
         # Normalize inputs for matching
-        business_objective = business_objective.lower().replace(" ", "_")
-        market_segment = market_segment.lower().replace(" ", "_")
-        time_horizon = time_horizon.lower().replace(" ", "_")
-        
-        # This would typically involve sophisticated analysis
-        # For demonstration, we'll return predefined strategies based on inputs
-        result = {
-            "business_objective": business_objective,
-            "market_segment": market_segment,
-            "time_horizon": time_horizon,
-            "available_budget": available_budget,
-            "recommended_strategies": [],
-            "implementation_plan": {},
-            "expected_outcomes": {},
-            "risk_assessment": {}
-        }
-        
-        # Generate recommendations based on business objective
-        strategies = self._get_strategies_by_objective(business_objective, market_segment, time_horizon)
-        result["recommended_strategies"] = strategies
-        
-        # Generate implementation plan
-        result["implementation_plan"] = self._generate_implementation_plan(strategies, time_horizon)
-        
-        # Generate expected outcomes
-        result["expected_outcomes"] = self._generate_expected_outcomes(business_objective, strategies)
-        
-        # Generate risk assessment
-        result["risk_assessment"] = self._generate_risk_assessment(strategies, current_challenges)
-        
-        # Generate budget allocation if budget is provided
-        if available_budget:
-            result["budget_allocation"] = self._generate_budget_allocation(strategies, available_budget)
-            
-        return result
-    
-    def _get_strategies_by_objective(self, business_objective: str, market_segment: str, time_horizon: str) -> List[Dict[str, Any]]:
-        """Get strategy recommendations based on business objective and other factors."""
-        # Define strategy templates for different objectives
-        strategy_templates = {
-            "increase_market_share": [
-                {
-                    "strategy": "Competitive Pricing Strategy",
-                    "description": "Implement competitive pricing to attract customers from competitors.",
-                    "tactics": [
-                        "Conduct comprehensive pricing analysis",
-                        "Identify price elasticity in target segments",
-                        "Develop tiered pricing options",
-                        "Implement strategic discounting for new customers"
-                    ],
-                    "suitable_for": ["price_sensitive", "b2c", "retail", "e_commerce"],
-                    "time_horizon": ["short_term", "medium_term"]
-                },
-                {
-                    "strategy": "Product Differentiation",
-                    "description": "Enhance product features to stand out from competitors.",
-                    "tactics": [
-                        "Conduct feature gap analysis against competitors",
-                        "Prioritize development of unique selling points",
-                        "Enhance product positioning",
-                        "Develop compelling messaging around differentiators"
-                    ],
-                    "suitable_for": ["premium", "b2b", "tech", "saas"],
-                    "time_horizon": ["medium_term", "long_term"]
-                },
-                {
-                    "strategy": "Market Expansion",
-                    "description": "Enter new geographic or demographic markets.",
-                    "tactics": [
-                        "Identify high-potential market segments",
-                        "Develop market entry strategy",
-                        "Adapt product/messaging for new markets",
-                        "Build channel partnerships in new regions"
-                    ],
-                    "suitable_for": ["established", "b2b", "b2c", "global"],
-                    "time_horizon": ["medium_term", "long_term"]
-                },
-                {
-                    "strategy": "Digital Channel Optimization",
-                    "description": "Enhance digital marketing to increase reach and acquisition.",
-                    "tactics": [
-                        "Audit current digital channel performance",
-                        "Reallocate budget to high-performing channels",
-                        "Implement advanced targeting capabilities",
-                        "Develop content strategy for organic growth"
-                    ],
-                    "suitable_for": ["digital_native", "e_commerce", "b2c", "d2c"],
-                    "time_horizon": ["short_term", "medium_term"]
-                }
-            ],
-            "improve_customer_retention": [
-                {
-                    "strategy": "Customer Loyalty Program",
-                    "description": "Implement or enhance loyalty program to increase retention.",
-                    "tactics": [
-                        "Design tiered reward structure",
-                        "Implement personalized loyalty benefits",
-                        "Develop exclusive content/features for loyal customers",
-                        "Create community elements for customer engagement"
-                    ],
-                    "suitable_for": ["retail", "b2c", "subscription", "service"],
-                    "time_horizon": ["short_term", "medium_term"]
-                },
-                {
-                    "strategy": "Customer Experience Enhancement",
-                    "description": "Improve customer experience across touchpoints.",
-                    "tactics": [
-                        "Map customer journey and identify friction points",
-                        "Implement customer feedback loops",
-                        "Enhance customer support capabilities",
-                        "Develop proactive engagement strategies"
-                    ],
-                    "suitable_for": ["b2b", "b2c", "service", "subscription"],
-                    "time_horizon": ["medium_term", "long_term"]
-                },
-                {
-                    "strategy": "Value-Added Services",
-                    "description": "Develop complementary services to increase customer value.",
-                    "tactics": [
-                        "Identify high-value service opportunities",
-                        "Develop bundling strategies",
-                        "Create educational content and resources",
-                        "Implement success management for key accounts"
-                    ],
-                    "suitable_for": ["b2b", "saas", "premium", "service"],
-                    "time_horizon": ["medium_term", "long_term"]
-                },
-                {
-                    "strategy": "Personalization Strategy",
-                    "description": "Implement data-driven personalization across customer interactions.",
-                    "tactics": [
-                        "Enhance customer data collection and integration",
-                        "Develop personalized content strategy",
-                        "Implement behavioral triggers for engagement",
-                        "Create personalized product recommendations"
-                    ],
-                    "suitable_for": ["e_commerce", "b2c", "retail", "subscription"],
-                    "time_horizon": ["short_term", "medium_term"]
-                }
-            ],
-            "launch_new_product": [
-                {
-                    "strategy": "Market Penetration Strategy",
-                    "description": "Aggressive entry to quickly gain market share.",
-                    "tactics": [
-                        "Competitive pricing strategy",
-                        "High-visibility promotional campaign",
-                        "Strategic partnerships for distribution",
-                        "Early adopter incentive program"
-                    ],
-                    "suitable_for": ["b2c", "tech", "startup", "consumer_goods"],
-                    "time_horizon": ["short_term"]
-                },
-                {
-                    "strategy": "Thought Leadership Campaign",
-                    "description": "Establish category leadership through expertise.",
-                    "tactics": [
-                        "Develop educational content series",
-                        "Secure speaking opportunities at industry events",
-                        "Publish original research/white papers",
-                        "Build relationships with industry influencers"
-                    ],
-                    "suitable_for": ["b2b", "saas", "professional_services", "tech"],
-                    "time_horizon": ["medium_term", "long_term"]
-                },
-                {
-                    "strategy": "Phased Rollout Strategy",
-                    "description": "Controlled launch across segments to optimize product.",
-                    "tactics": [
-                        "Identify beta testing customer segments",
-                        "Develop feedback collection mechanisms",
-                        "Create rapid iteration processes",
-                        "Plan phase-based expansion roadmap"
-                    ],
-                    "suitable_for": ["b2b", "tech", "saas", "complex_products"],
-                    "time_horizon": ["medium_term"]
-                },
-                {
-                    "strategy": "Integrated Launch Campaign",
-                    "description": "Coordinated multi-channel campaign for maximum impact.",
-                    "tactics": [
-                        "Develop unified messaging strategy",
-                        "Create coordinated content across channels",
-                        "Plan sequential reveal strategy",
-                        "Implement measurement framework for optimization"
-                    ],
-                    "suitable_for": ["b2c", "consumer_goods", "retail", "e_commerce"],
-                    "time_horizon": ["short_term", "medium_term"]
-                }
-            ],
-            "increase_brand_awareness": [
-                {
-                    "strategy": "Content Marketing Strategy",
-                    "description": "Build awareness through valuable content.",
-                    "tactics": [
-                        "Develop content pillars aligned with audience interests",
-                        "Create multi-format content strategy",
-                        "Implement SEO optimization for discoverability",
-                        "Establish content distribution partnerships"
-                    ],
-                    "suitable_for": ["b2b", "b2c", "service", "thought_leadership"],
-                    "time_horizon": ["medium_term", "long_term"]
-                },
-                {
-                    "strategy": "Influencer Partnership Program",
-                    "description": "Leverage influencers to expand brand reach.",
-                    "tactics": [
-                        "Identify relevant influencers across tiers",
-                        "Develop authentic partnership frameworks",
-                        "Create co-branded content opportunities",
-                        "Implement performance-based compensation models"
-                    ],
-                    "suitable_for": ["b2c", "consumer_goods", "lifestyle", "e_commerce"],
-                    "time_horizon": ["short_term", "medium_term"]
-                },
-                {
-                    "strategy": "Community Building Initiative",
-                    "description": "Create engaged community around brand values.",
-                    "tactics": [
-                        "Develop community platform strategy",
-                        "Create valuable engagement opportunities",
-                        "Implement user-generated content program",
-                        "Establish ambassador program for advocates"
-                    ],
-                    "suitable_for": ["b2c", "lifestyle", "value_driven", "subscription"],
-                    "time_horizon": ["medium_term", "long_term"]
-                },
-                {
-                    "strategy": "Strategic PR Campaign",
-                    "description": "Generate earned media coverage for brand.",
-                    "tactics": [
-                        "Develop newsworthy storylines",
-                        "Build relationships with key media outlets",
-                        "Create press kit and supporting materials",
-                        "Plan staged announcement strategy"
-                    ],
-                    "suitable_for": ["b2b", "b2c", "launch", "corporate"],
-                    "time_horizon": ["short_term", "medium_term"]
-                }
-            ]
-        }
-        
-        # Default objective if not found
-        if business_objective not in strategy_templates:
-            business_objective = "increase_market_share"
-            
-        # Get all strategies for the objective
-        all_strategies = strategy_templates[business_objective]
-        
-        # Filter strategies based on market segment and time horizon
-        filtered_strategies = []
-        for strategy in all_strategies:
-            # Check if strategy is suitable for the time horizon
-            if time_horizon in strategy["time_horizon"]:
-                # Check if strategy is suitable for the market segment
-                # This is a simplified matching - in a real system this would be more sophisticated
-                segment_match = False
-                for suitable_segment in strategy["suitable_for"]:
-                    if suitable_segment in market_segment:
-                        segment_match = True
-                        break
-                
-                # Add strategy if it matches or if we couldn't determine a match
-                if segment_match or not any(segment in market_segment for segment in ["b2b", "b2c", "retail", "tech"]):
-                    # Create a copy without the matching metadata
-                    strategy_copy = {
-                        "strategy": strategy["strategy"],
-                        "description": strategy["description"],
-                        "tactics": strategy["tactics"]
-                    }
-                    filtered_strategies.append(strategy_copy)
-        
-        # If no strategies match, return at least 2 generic ones
-        if not filtered_strategies and all_strategies:
-            for i in range(min(2, len(all_strategies))):
-                strategy_copy = {
-                    "strategy": all_strategies[i]["strategy"],
-                    "description": all_strategies[i]["description"],
-                    "tactics": all_strategies[i]["tactics"]
-                }
-                filtered_strategies.append(strategy_copy)
+        business_objective = sys.intern(business_objective.translate(_NORMALIZE))
+        market_segment = sys.intern(market_segment.translate(_NORMALIZE))
+        time_horizon = sys.intern(time_horizon.translate(_NORMALIZE))
         
-        return filtered_strategies
-    
-    def _generate_implementation_plan(self, strategies: List[Dict[str, Any]], time_horizon: str) -> Dict[str, Any]:
-        """Generate an implementation plan for the recommended strategies."""
-        # Set timeline based on time horizon
-        if time_horizon == "short_term":
-            timeline_unit = "weeks"
-            total_duration = 12  # 12 weeks
-        elif time_horizon == "medium_term":
-            timeline_unit = "months"
-            total_duration = 12  # 12 months
-        else:  # long_term
-            timeline_unit = "quarters"
-            total_duration = 8  # 8 quarters
-            
-        plan = {
-            "timeline_unit": timeline_unit,
-            "total_duration": total_duration,
-            "phases": []
-        }
-        
-        # Create implementation phases
-        if len(strategies) > 0:
-            # Divide the total duration among strategies with some overlap
-            phase_duration = max(2, total_duration // len(strategies) + 1)
-            
-            for i, strategy in enumerate(strategies):
-                start_time = max(0, i * phase_duration - 1)
-                end_time = min(total_duration, start_time + phase_duration)
-                
-                phase = {
-                    "phase": f"Phase {i+1}: {strategy['strategy']}",
-                    "start": start_time,
-                    "end": end_time,
-                    "key_milestones": []
-                }
-                
-                # Generate milestones based on tactics
-                for j, tactic in enumerate(strategy["tactics"]):
-                    milestone_time = start_time + (j * (end_time - start_time)) // (len(strategy["tactics"]) + 1)
-                    
-                    milestone = {
-                        "milestone": f"Complete {tactic}",
-                        "timeline": milestone_time,
-                        "dependencies": [] if j == 0 else [f"Milestone {j}"]
-                    }
-                    
-                    phase["key_milestones"].append(milestone)
-                
-                plan["phases"].append(phase)
-        
-        return plan
-    
-    def _generate_expected_outcomes(self, business_objective: str, strategies: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Generate expected outcomes for the recommended strategies."""
-        outcomes = {
-            "primary_metrics": [],
-            "secondary_metrics": [],
-            "estimated_impact": {}
-        }
-        
-        # Define primary metrics based on business objective
-        metrics_by_objective = {
-            "increase_market_share": {
-                "primary": ["Market share percentage", "New customer acquisition", "Competitive win rate"],
-                "secondary": ["Share of voice", "Brand consideration", "Product adoption rate"]
-            },
-            "improve_customer_retention": {
-                "primary": ["Customer retention rate", "Churn rate", "Customer lifetime value"],
-                "secondary": ["Net promoter score", "Repeat purchase rate", "Account expansion rate"]
-            },
-            "launch_new_product": {
-                "primary": ["Product adoption rate", "Revenue from new product", "Market penetration"],
-                "secondary": ["Product awareness", "Feature usage", "Cross-sell rate"]
-            },
-            "increase_brand_awareness": {
-                "primary": ["Brand awareness", "Share of voice", "Brand search volume"],
-                "secondary": ["Social media engagement", "Press mentions", "Website traffic"]
-            }
-        }
-        
-        # Use default metrics if objective not found
-        if business_objective not in metrics_by_objective:
-            business_objective = "increase_market_share"
-            
-        outcomes["primary_metrics"] = metrics_by_objective[business_objective]["primary"]
-        outcomes["secondary_metrics"] = metrics_by_objective[business_objective]["secondary"]
-        
-        # Generate estimated impact
-        impact_ranges = {
-            "increase_market_share": {"low": "5-8%", "medium": "8-15%", "high": "15-25%"},
-            "improve_customer_retention": {"low": "10-15%", "medium": "15-25%", "high": "25-40%"},
-            "launch_new_product": {"low": "2-5%", "medium": "5-10%", "high": "10-20%"},
-            "increase_brand_awareness": {"low": "20-30%", "medium": "30-50%", "high": "50-100%"}
-        }
-        
-        # Determine impact level based on number and types of strategies
-        impact_level = "medium"
-        if len(strategies) >= 3:
-            impact_level = "high"
-        elif len(strategies) <= 1:
-            impact_level = "low"
-            
-        # Get impact range for the business objective
-        impact_range = impact_ranges.get(
-            business_objective, 
-            {"low": "5-10%", "medium": "10-20%", "high": "20-30%"}
-        )[impact_level]
-        
-        # Generate impact statements
-        outcomes["estimated_impact"] = {
-            "overall_impact": f"Expected {impact_level} impact with {impact_range} improvement in primary metrics",
-            "timeline_to_results": self._get_timeline_to_results(business_objective),
-            "key_performance_indicators": outcomes["primary_metrics"][:2],
-            "success_criteria": f"Achieve minimum {impact_range.split('-')[0]}% improvement in primary metrics"
-        }
-        
-        return outcomes
-    
-    def _get_timeline_to_results(self, business_objective: str) -> str:
-        """Get expected timeline to results based on business objective."""
-        timelines = {
-            "increase_market_share": "3-6 months for initial results, 6-12 months for full impact",
-            "improve_customer_retention": "1-3 months for initial results, 6-9 months for full impact",
-            "launch_new_product": "1-2 months for initial traction, 3-6 months for significant adoption",
-            "increase_brand_awareness": "2-3 months for initial lift, 6-12 months for significant awareness increase"
-        }
-        
-        return timelines.get(
+        # Results are cached; decoding the cached JSON gives callers their own copy
+        _, serialized = _compute_recommendation(
             business_objective,
-            "3-6 months for initial results, 6-12 months for full impact"
+            market_segment,
+            time_horizon,
+            available_budget,
+            tuple(current_challenges)
         )
-    
-    def _generate_risk_assessment(self, strategies: List[Dict[str, Any]], current_challenges: List[str]) -> Dict[str, Any]:
-        """Generate risk assessment for the recommended strategies."""
-        risk_assessment = {
-            "key_risks": [],
-            "mitigation_strategies": {}
-        }
-        
-        # Common risks based on strategy types
-        common_risks = {
-            "Competitive Pricing Strategy": [
-                "Potential margin erosion",
-                "Competitive retaliation",
-                "Price war escalation"
-            ],
-            "Product Differentiation": [
-                "Feature development delays",
-                "Insufficient differentiation",
-                "High development costs"
-            ],
-            "Market Expansion": [
-                "Cultural/regional adaptation challenges",
-                "Regulatory compliance issues",
-                "Resource dispersion"
-            ],
-            "Digital Channel Optimization": [
-                "Rising acquisition costs",
-                "Algorithm changes affecting performance",
-                "Technical implementation challenges"
-            ],
-            "Customer Loyalty Program": [
-                "Low adoption rates",
-                "Reward cost management",
-                "Program complexity"
-            ],
-            "Market Penetration Strategy": [
-                "Higher than expected acquisition costs",
-                "Slower than projected adoption",
-                "Supply chain constraints"
-            ],
-            "Content Marketing Strategy": [
-                "Content production resource constraints",
-                "Difficulty measuring direct ROI",
-                "Audience building timeline"
-            ]
-        }
-        
-        # Generate key risks based on strategy types and current challenges
-        for strategy in strategies:
-            strategy_name = strategy["strategy"]
-            
-            # Add common risks for this strategy type
-            if strategy_name in common_risks:
-                for risk in common_risks[strategy_name]:
-                    if risk not in risk_assessment["key_risks"]:
-                        risk_assessment["key_risks"].append(risk)
-        
-        # Add risks based on current challenges
-        for challenge in current_challenges:
-            challenge_risk = f"Existing challenge: {challenge}"
-            if challenge_risk not in risk_assessment["key_risks"]:
-                risk_assessment["key_risks"].append(challenge_risk)
-                
-        # Limit to top 5 risks
-        risk_assessment["key_risks"] = risk_assessment["key_risks"][:5]
-        
-        # Generate mitigation strategies for each risk
-        for risk in risk_assessment["key_risks"]:
-            # Common mitigation patterns
-            if "pricing" in risk.lower() or "margin" in risk.lower():
-                risk_assessment["mitigation_strategies"][risk] = "Implement value-based pricing strategy with tiered options to protect margins"
-            elif "competitive" in risk.lower() or "retaliation" in risk.lower():
-                risk_assessment["mitigation_strategies"][risk] = "Develop scenario planning for competitive responses; prepare contingency plans"
-            elif "delay" in risk.lower() or "timeline" in risk.lower():
-                risk_assessment["mitigation_strategies"][risk] = "Implement agile methodology with regular milestones and flexible resource allocation"
-            elif "cost" in risk.lower() or "budget" in risk.lower():
-                risk_assessment["mitigation_strategies"][risk] = "Establish clear budget thresholds with stage-gate approach; prioritize initiatives by ROI"
-            elif "adoption" in risk.lower() or "engagement" in risk.lower():
-                risk_assessment["mitigation_strategies"][risk] = "Develop staged rollout with feedback loops; create targeted incentives for early adoption"
-            elif "measurement" in risk.lower() or "roi" in risk.lower():
-                risk_assessment["mitigation_strategies"][risk] = "Implement comprehensive attribution model; establish proxy metrics for long-term initiatives"
-            elif "resource" in risk.lower():
-                risk_assessment["mitigation_strategies"][risk] = "Create flexible resourcing plan with external partner options; prioritize initiatives"
-            else:
-                risk_assessment["mitigation_strategies"][risk] = "Establish monitoring system with early warning indicators; create contingency plans"
-                
-        return risk_assessment
-    
-    def _generate_budget_allocation(self, strategies: List[Dict[str, Any]], available_budget: str) -> Dict[str, Any]:
-        """Generate budget allocation for the recommended strategies."""
-        budget_allocation = {
-            "budget_level": available_budget,
-            "allocation_by_strategy": {},
-            "allocation_by_category": {}
-        }
-        
-        # Standard allocation categories
-        categories = [
-            "Media & Advertising",
-            "Content Production",
-            "Technology & Tools",
-            "Research & Analysis",
-            "Personnel & Resources"
-        ]
-        
-        # Allocate budget by strategy
-        total_strategies = len(strategies)
-        if total_strategies > 0:
-            # Give higher weight to first strategy, gradually decreasing
-            weights = []
-            for i in range(total_strategies):
-                weight = 1.0 - (i * 0.15)  # Decrease by 15% for each subsequent strategy
-                weights.append(max(0.3, weight))  # Minimum weight of 30%
-                
-            # Normalize weights
-            total_weight = sum(weights)
-            weights = [w / total_weight for w in weights]
-            
-            # Allocate by strategy
-            for i, strategy in enumerate(strategies):
-                allocation_pct = int(round(weights[i] * 100))
-                budget_allocation["allocation_by_strategy"][strategy["strategy"]] = f"{allocation_pct}%"
-                
-        # Allocate by category based on strategy types
-        category_allocations = {
-            "Media & Advertising": 0,
-            "Content Production": 0,
-            "Technology & Tools": 0,
-            "Research & Analysis": 0,
-            "Personnel & Resources": 0
-        }
-        
-        for strategy in strategies:
-            strategy_name = strategy["strategy"]
-            
-            # Different strategies have different category weights
-            if "Digital" in strategy_name or "Campaign" in strategy_name:
-                category_allocations["Media & Advertising"] += 40
-                category_allocations["Content Production"] += 25
-                category_allocations["Technology & Tools"] += 15
-                category_allocations["Research & Analysis"] += 10
-                category_allocations["Personnel & Resources"] += 10
-            elif "Content" in strategy_name:
-                category_allocations["Media & Advertising"] += 20
-                category_allocations["Content Production"] += 45
-                category_allocations["Technology & Tools"] += 10
-                category_allocations["Research & Analysis"] += 10
-                category_allocations["Personnel & Resources"] += 15
-            elif "Product" in strategy_name:
-                category_allocations["Media & Advertising"] += 15
-                category_allocations["Content Production"] += 20
-                category_allocations["Technology & Tools"] += 25
-                category_allocations["Research & Analysis"] += 20
-                category_allocations["Personnel & Resources"] += 20
-            elif "Loyalty" in strategy_name or "Experience" in strategy_name:
-                category_allocations["Media & Advertising"] += 10
-                category_allocations["Content Production"] += 15
-                category_allocations["Technology & Tools"] += 35
-                category_allocations["Research & Analysis"] += 15
-                category_allocations["Personnel & Resources"] += 25
-            else:  # Default allocation
-                category_allocations["Media & Advertising"] += 25
-                category_allocations["Content Production"] += 20
-                category_allocations["Technology & Tools"] += 20
-                category_allocations["Research & Analysis"] += 15
-                category_allocations["Personnel & Resources"] += 20
-                
-        # Normalize category allocations
-        if strategies:
-            total_allocation = sum(category_allocations.values())
-            for category, allocation in category_allocations.items():
-                normalized_pct = int(round(allocation / total_allocation * 100))
-                budget_allocation["allocation_by_category"][category] = f"{normalized_pct}%"
-        
-        return budget_allocation 
\ No newline at end of file
+        return orjson.loads(serialized) 
\ No newline at end of file
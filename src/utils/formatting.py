@@ -2,8 +2,38 @@
 Formatting utilities for the Marketing Analyst Agent CLI.
 """
 
+import functools
+import itertools
+import os
 import re
-from typing import Dict, Any, List, Optional, Union
+import sys
+from typing import Dict, Any, FrozenSet, List, Optional, Pattern, Sequence, Union
+
+# ANSI color codes
+HIGHLIGHT_START = "\033[1;33m"  # Bold yellow
+HIGHLIGHT_END = "\033[0m"       # Reset
+
+# Replacement template wrapping each highlighted match in the color codes
+_HIGHLIGHT_REPL = f"{HIGHLIGHT_START}\\g<0>{HIGHLIGHT_END}"
+
+# Single-pass pattern for format_cli_response: numbered list items and bullet
+# points run together on one line, and header lines
+_RE_CLI_BREAKS = re.compile(
+    r'(?P<num>\d+\.\s[^\n]+?)(?=\d+\.\s)'
+    r'|(?P<hdr>#+\s[^\n]+)\n'
+    r'|(?P<bul>\*\s[^\n]+?)(?=\*\s)'
+)
+
+# Every numbered-list match contains one of these; used to skip plain text
+_RE_NUMBER_MARKER = re.compile(r'\d\.\s')
+
+# Text appended after each kind of match (a header match already ends in \n)
+_CLI_BREAK_SUFFIX = {"num": "\n\n", "hdr": "\n", "bul": "\n"}
+
+
+def _cli_break(match: re.Match) -> str:
+    """Append the line breaks for one _RE_CLI_BREAKS match."""
+    return match.group(0) + _CLI_BREAK_SUFFIX[match.lastgroup]
 
 
 def format_cli_response(text: str) -> str:
@@ -17,16 +47,25 @@ def format_cli_response(text: str) -> str:
     Returns:
         Formatted text for CLI display
     """
-    # Add proper line breaks
-    text = re.sub(r'(\d+\.\s[^\n]+)(?=\d+\.)', r'\1\n\n', text)
+    # Plain text (no header, bullet or numbered item markers) is left as is
+    if '#' not in text and '*' not in text and not _RE_NUMBER_MARKER.search(text):
+        return text
     
-    # Add spacing after headers
-    text = re.sub(r'(#+\s[^\n]+)\n', r'\1\n\n', text)
-    
-    # Add spacing for bullet points
-    text = re.sub(r'(\*\s[^\n]+)(?=\*\s)', r'\1\n', text)
-    
-    return text
+    # Add line breaks between numbered items and bullet points, and spacing
+    # after headers, in one pass
+    return _RE_CLI_BREAKS.sub(_cli_break, text)
+
+
+def _table_separator(col_widths: List[int]) -> str:
+    """Build a '+---+---+' separator line in one buffer, without a string per column."""
+    buf = bytearray(b'-' * (sum(col_widths) + 3 * len(col_widths) + 1))
+    buf[0] = ord('+')
+    pos = 0
+    for width in col_widths:
+        # Each column is its width plus one space of padding on either side
+        pos += width + 3
+        buf[pos] = ord('+')
+    return buf.decode('ascii')
 
 
 def format_table(headers: List[str], rows: List[List[str]], title: Optional[str] = None) -> str:
@@ -44,54 +83,84 @@ def format_table(headers: List[str], rows: List[List[str]], title: Optional[str]
     if not rows:
         return "No data available."
     
-    # Determine column widths
-    col_widths = [len(h) for h in headers]
-    for row in rows:
-        for i, cell in enumerate(row):
-            col_widths[i] = max(col_widths[i], len(str(cell)))
+    # Convert each non-string cell to a string once
+    str_rows = [[cell if isinstance(cell, str) else str(cell) for cell in row] for row in rows]
+    
+    # Determine column widths (rows may be shorter than the headers)
+    columns = itertools.chain(itertools.zip_longest(*str_rows, fillvalue=""), itertools.repeat(()))
+    col_widths = [max(len(h), max(map(len, column), default=0)) for h, column in zip(headers, columns)]
+    
+    # Create table format; the row template is parsed once for all rows
+    separator = _table_separator(col_widths)
+    row_template = '| ' + ' | '.join([f'{{:<{width}}}' for width in col_widths]) + ' |'
+    header_row = row_template.format(*headers)
     
-    # Create table format
-    separator = '+' + '+'.join(['-' * (width + 2) for width in col_widths]) + '+'
-    header_row = '|' + '|'.join([f' {h:<{col_widths[i]}} ' for i, h in enumerate(headers)]) + '|'
+    # Build the table; the whole body is rendered by a single format call over
+    # every cell, with short rows padded with empty cells
+    n_cols = len(col_widths)
+    padding = [""] * n_cols
+    cells = itertools.chain.from_iterable(
+        row if len(row) == n_cols else (row + padding)[:n_cols] for row in str_rows
+    )
+    body = '\n'.join([row_template] * len(str_rows)).format(*cells)
+    title_rows = [separator, f"|{title.center(len(separator) - 2)}|"] if title else []
     
-    # Build the table
-    table = []
-    if title:
-        title_width = len(separator) - 2
-        table.append(separator)
-        table.append(f"|{title.center(title_width)}|")
+    return '\n'.join([*title_rows, separator, header_row, separator, body, separator])
+
+
+def color_enabled() -> bool:
+    """
+    Check whether ANSI highlighting should be written to stdout.
     
-    table.append(separator)
-    table.append(header_row)
-    table.append(separator)
+    Color is skipped when stdout is not a terminal (piped or redirected) or
+    when the NO_COLOR environment variable is set (https://no-color.org).
     
-    for row in rows:
-        row_str = '|' + '|'.join([f' {str(cell):<{col_widths[i]}} ' for i, cell in enumerate(row)]) + '|'
-        table.append(row_str)
+    Returns:
+        True if highlighted output should be produced
+    """
+    return sys.stdout.isatty() and not os.environ.get("NO_COLOR")
+
+@functools.lru_cache(maxsize=32)
+def _build_highlighter(terms: FrozenSet[str]) -> Optional[Pattern]:
+    """Compile a single case-insensitive alternation for the given terms."""
+    unique_terms = sorted((term for term in terms if term), key=lambda term: (-len(term), term))
+    if not unique_terms:
+        return None
+    return re.compile("|".join(map(re.escape, unique_terms)), re.IGNORECASE)
+
+
+def compile_highlighter(terms: Sequence[str]) -> Optional[Pattern]:
+    """
+    Compile the highlight terms into one reusable pattern.
     
-    table.append(separator)
+    Longer terms are tried first so overlapping terms highlight the longest match.
     
-    return '\n'.join(table)
+    Args:
+        terms: Terms to highlight
+        
+    Returns:
+        Compiled pattern, or None if there is nothing to highlight
+    """
+    # Keyed by the set of terms, so order and repeats share one pattern
+    return _build_highlighter(frozenset(terms))
 
 
-def highlight_text(text: str, highlights: List[str]) -> str:
+def highlight_text(text: str, highlights: Union[Sequence[str], Pattern, None]) -> str:
     """
     Highlight specified terms in the text (when terminal supports it).
     
     Args:
         text: The text to highlight
-        highlights: List of terms to highlight
+        highlights: List of terms to highlight, or a pattern from compile_highlighter
         
     Returns:
         Text with highlighted terms
     """
-    # ANSI color codes
-    HIGHLIGHT_START = "\033[1;33m"  # Bold yellow
-    HIGHLIGHT_END = "\033[0m"       # Reset
+    if not highlights:
+        return text
     
-    result = text
-    for term in highlights:
-        pattern = re.compile(re.escape(term), re.IGNORECASE)
-        result = pattern.sub(f"{HIGHLIGHT_START}\\g<0>{HIGHLIGHT_END}", result)
+    pattern = highlights if isinstance(highlights, re.Pattern) else compile_highlighter(highlights)
+    if pattern is None:
+        return text
     
-    return result 
\ No newline at end of file
+    return pattern.sub(_HIGHLIGHT_REPL, text)
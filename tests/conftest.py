@@ -0,0 +1,41 @@
+"""
+Shared test fixtures.
+"""
+
+import pytest
+
+from src.tools.cache import ToolCache
+
+
+class FakeRedis:
+    """In-memory stand-in for redis.Redis covering the calls ToolCache makes."""
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+        self.error = None
+
+    def get(self, key):
+        if self.error is not None:
+            raise self.error
+        return self.store.get(key)
+
+    def set(self, key, value, ex=None):
+        if self.error is not None:
+            raise self.error
+        self.store[key] = value
+        self.ttls[key] = ex
+
+
+@pytest.fixture
+def fake_redis():
+    """A FakeRedis client; set its error attribute to simulate an outage."""
+    return FakeRedis()
+
+
+@pytest.fixture
+def tool_cache(fake_redis):
+    """A ToolCache backed by the fake_redis client."""
+    cache = ToolCache()
+    cache.client = fake_redis
+    return cache
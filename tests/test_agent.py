@@ -6,60 +6,59 @@ import os
 import pytest
 from unittest.mock import patch, MagicMock
 
-from src.agents.marketing_analyst import MarketingAnalystAgent
+from src.agents.marketing_analyst import (
+    _MOCK_DEFAULT_RESPONSE,
+    _MOCK_RESPONSES,
+    MarketingAnalystAgent,
+    MockLLM,
+)
 from src.config import settings
 
 # Skip tests if OPENAI_API_KEY is not set
-pytestmark = pytest.mark.skipif(
+requires_openai_key = pytest.mark.skipif(
     not os.environ.get("OPENAI_API_KEY"), 
     reason="OPENAI_API_KEY environment variable not set"
 )
 
-class TestMarketingAnalystAgent:
-    """Tests for the MarketingAnalystAgent class."""
-    
-    def setup_method(self):
-        """Set up test environment before each test method."""
-        # Use a mock for the LLM to avoid API calls during testing
-        self.llm_patcher = patch('langchain_openai.ChatOpenAI')
-        self.mock_llm = self.llm_patcher.start()
-        self.mock_llm.return_value = MagicMock()
-        
-        # Mock tools
-        self.tools_patcher = patch('src.agents.marketing_analyst.MarketingAnalystAgent._get_tools')
-        self.mock_tools = self.tools_patcher.start()
-        self.mock_tools.return_value = []
-        
+@pytest.fixture(scope="class")
+def shared_agent():
+    """Create one agent with a mocked LLM and tools for all tests in a class."""
+    # Use a mock for the LLM to avoid API calls during testing, and mock tools
+    with patch('langchain_openai.ChatOpenAI', return_value=MagicMock()), \
+            patch('src.agents.marketing_analyst.MarketingAnalystAgent._get_tools', return_value=[]):
         # Create agent with mocked dependencies
-        self.agent = MarketingAnalystAgent(
+        yield MarketingAnalystAgent(
             model_name="gpt-3.5-turbo",
             enable_tracing=False,
             verbose=False
         )
-        
+
+@requires_openai_key
+class TestMarketingAnalystAgent:
+    """Tests for the MarketingAnalystAgent class."""
+    
+    @pytest.fixture
+    def agent(self, shared_agent):
+        """Give each test the shared agent with a fresh mocked executor."""
         # Mock the agent executor
-        self.agent.agent_executor = MagicMock()
-        self.agent.agent_executor.invoke.return_value = {
+        shared_agent.agent_executor = MagicMock()
+        shared_agent.agent_executor.invoke.return_value = {
             "output": "Mocked response from the marketing analyst agent",
             "some_other_key": "some_value"
         }
-        
-    def teardown_method(self):
-        """Clean up after each test method."""
-        self.llm_patcher.stop()
-        self.tools_patcher.stop()
+        return shared_agent
     
-    def test_agent_initialization(self):
+    def test_agent_initialization(self, agent):
         """Test that the agent initializes correctly."""
-        assert self.agent is not None
-        assert self.agent.model_name == "gpt-3.5-turbo"
-        assert self.agent.enable_tracing is False
-        assert self.agent.verbose is False
+        assert agent is not None
+        assert agent.model_name == "gpt-3.5-turbo"
+        assert agent.enable_tracing is False
+        assert agent.verbose is False
     
-    def test_agent_run(self):
+    def test_agent_run(self, agent):
         """Test that the agent run method works correctly."""
         # Run the agent
-        response = self.agent.run(query="Analyze market trends in the tech industry")
+        response = agent.run(query="Analyze market trends in the tech industry")
         
         # Check response
         assert isinstance(response, dict)
@@ -69,21 +68,50 @@ class TestMarketingAnalystAgent:
         assert response["success"] is True
         
         # Verify the agent executor was called correctly
-        self.agent.agent_executor.invoke.assert_called_once_with(
+        agent.agent_executor.invoke.assert_called_once_with(
             {"input": "Analyze market trends in the tech industry"}
         )
     
-    def test_agent_run_with_exception(self):
+    def test_agent_run_with_exception(self, agent):
         """Test that the agent handles exceptions correctly."""
         # Set up the mock to raise an exception
-        self.agent.agent_executor.invoke.side_effect = Exception("Test exception")
+        agent.agent_executor.invoke.side_effect = Exception("Test exception")
         
         # Run the agent
-        response = self.agent.run(query="Analyze market trends in the tech industry")
+        response = agent.run(query="Analyze market trends in the tech industry")
         
         # Check response
         assert isinstance(response, dict)
         assert "response" in response
         assert "success" in response
         assert "An error occurred: Test exception" in response["response"]
-        assert response["success"] is False 
\ No newline at end of file
+        assert response["success"] is False 
+
+
+@pytest.mark.parametrize("prompt,keyword", [
+    ("What are the trends in Mobile Gaming?", "mobile gaming"),
+    ("Compare us with each COMPETITOR", "competitor"),
+    ("Write a report on sentiment", "sentiment"),
+    ("Recommend a strategy", "strategy"),
+    # Matches case-insensitively through Unicode case folding (\u017f is a long s)
+    ("Suggest a \u017ftrategy", "strategy"),
+])
+def test_mock_llm_picks_highest_priority_keyword(prompt, keyword):
+    """The mock LLM answers for the highest-priority keyword in the prompt."""
+    assert MockLLM()._call(prompt) == _MOCK_RESPONSES[keyword]
+
+
+def test_mock_llm_default_response():
+    """Prompts without a keyword get the default response."""
+    assert MockLLM()._call("Hello there") == _MOCK_DEFAULT_RESPONSE
+
+
+@pytest.mark.parametrize("memory_window", [1, 3, 10])
+def test_memory_window_bounds_memory(monkeypatch, memory_window):
+    """The agent keeps the requested number of turns in memory."""
+    monkeypatch.setattr(settings, "DEBUG_MODE", False)
+    with patch('langchain_openai.ChatOpenAI', return_value=MagicMock()), \
+            patch('src.agents.marketing_analyst.MarketingAnalystAgent._get_tools', return_value=[]):
+        agent = MarketingAnalystAgent(enable_tracing=False, verbose=False, memory_window=memory_window)
+
+    assert agent.memory.k == memory_window
@@ -0,0 +1,96 @@
+"""
+Tests for the tool result cache.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.tools import cache as cache_module
+from src.tools.cache import ToolCache
+from src.tools.market_data import (
+    CompetitorAnalysisTool,
+    ConsumerSentimentTool,
+    MarketTrendAnalysisTool,
+)
+
+TOOL_INPUTS = [
+    (MarketTrendAnalysisTool, {
+        "market_segment": "mobile gaming",
+        "time_period": "Q2 2023",
+        "metrics": ["growth_rate"]
+    }),
+    (CompetitorAnalysisTool, {
+        "competitors": ["Acme"],
+        "metrics": ["market_share"],
+        "time_period": "current"
+    }),
+    (ConsumerSentimentTool, {
+        "product_or_brand": "Acme",
+        "channels": ["reviews"],
+        "time_period": "last 3 months"
+    }),
+]
+
+
+def test_disabled_without_url():
+    """Without a Redis URL nothing is cached."""
+    cache = ToolCache()
+    assert not cache.enabled
+    cache.set("key", b"value", 60)
+    assert cache.get("key") is None
+
+
+def test_miss_then_hit(tool_cache, fake_redis):
+    """A miss returns None; after a set the value is served from Redis."""
+    assert tool_cache.get("key") is None
+
+    tool_cache.set("key", b"value", 60)
+
+    assert fake_redis.store["key"] == b"value"
+    assert fake_redis.ttls["key"] == 60
+    assert tool_cache.get("key") == b"value"
+
+
+def test_redis_error_serves_stale(tool_cache, fake_redis):
+    """When Redis fails, values written earlier are served from the stale store."""
+    redis = pytest.importorskip("redis")
+    tool_cache.set("key", b"value", 60)
+    fake_redis.error = redis.ConnectionError("down")
+
+    assert tool_cache.get("key") == b"value"
+    assert tool_cache.get("other") is None
+    # Writes while Redis is down are kept for stale reads
+    tool_cache.set("later", b"new", 60)
+    assert tool_cache.get("later") == b"new"
+
+
+def test_stale_store_is_capped(tool_cache, monkeypatch):
+    """The stale store evicts the least recently written entries past its cap."""
+    monkeypatch.setattr(cache_module, "_STALE_MAX_ENTRIES", 2)
+    for key in ("a", "b", "a", "c"):
+        tool_cache.set(key, key.encode(), 60)
+
+    assert list(tool_cache._stale) == ["a", "c"]
+
+
+@pytest.mark.parametrize("tool_cls,tool_input", TOOL_INPUTS)
+def test_tool_ttl(tool_cls, tool_input, tool_cache, fake_redis):
+    """Each tool writes its results with its own TTL."""
+    with patch("src.tools.market_data.get_tool_cache", return_value=tool_cache):
+        tool_cls().invoke(tool_input)
+
+    assert list(fake_redis.ttls.values()) == [tool_cls.ttl]
+
+
+def test_tool_ttls_differ():
+    """TTLs follow how often each tool's data changes."""
+    assert ConsumerSentimentTool.ttl < CompetitorAnalysisTool.ttl < MarketTrendAnalysisTool.ttl
+
+
+def test_make_key_ignores_argument_order():
+    """The key depends on the tool and argument values, not on dict key order."""
+    key = ToolCache.make_key("tool", {"a": 1, "b": [1, 2]})
+
+    assert ToolCache.make_key("tool", {"b": [1, 2], "a": 1}) == key
+    assert ToolCache.make_key("other_tool", {"a": 1, "b": [1, 2]}) != key
+    assert ToolCache.make_key("tool", {"a": 1, "b": [2, 1]}) != key
@@ -0,0 +1,42 @@
+"""
+Tests for the check_env.py environment conflict checker.
+"""
+
+import pytest
+
+from check_env import _mask, _snapshot
+
+
+@pytest.mark.parametrize("value", ["", "a", "sk-short", "x" * 15])
+def test_mask_hides_short_values(value):
+    """Values too short to show a prefix and suffix are hidden entirely."""
+    assert _mask(value) == "***"
+
+
+@pytest.mark.parametrize("value", [
+    "sk-0123456789abcdef",
+    "sk-proj-" + "0123456789" * 5,
+])
+def test_mask_shows_only_prefix_and_suffix(value):
+    """Long values show their first 10 and last 5 characters and nothing between."""
+    masked = _mask(value)
+
+    assert masked == value[:10] + "..." + value[-5:]
+    assert value[10:-5] not in masked
+
+
+def test_snapshot_masks_api_keys(monkeypatch):
+    """API keys are masked, other variables shown as is and unset ones skipped."""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-0123456789abcdef")
+    monkeypatch.setenv("OPENAI_API_BASE", "https://example.com/v1")
+    monkeypatch.delenv("LANGSMITH_API_KEY", raising=False)
+
+    snapshot = _snapshot(
+        ["OPENAI_API_KEY", "OPENAI_API_BASE", "LANGSMITH_API_KEY"],
+        frozenset({"OPENAI_API_KEY", "LANGSMITH_API_KEY"})
+    )
+
+    assert snapshot == {
+        "OPENAI_API_KEY": "sk-0123456...bcdef",
+        "OPENAI_API_BASE": "https://example.com/v1"
+    }
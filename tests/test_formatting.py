@@ -2,81 +2,82 @@
 Tests for the formatting utilities.
 """
 
-import unittest
-from src.utils.formatting import format_cli_response, format_table, highlight_text
-
-
-class TestFormatting(unittest.TestCase):
-    """Tests for the formatting utilities."""
-
-    def test_format_cli_response(self):
-        """Test the CLI response formatting."""
-        # Test numbered list formatting
-        numbered_list = "1. First item2. Second item3. Third item"
-        expected = "1. First item\n\n2. Second item\n\n3. Third item"
-        self.assertEqual(format_cli_response(numbered_list), expected)
-
-        # Test header formatting
-        headers = "# Header\nSome text\n## Subheader\nMore text"
-        expected = "# Header\n\nSome text\n## Subheader\n\nMore text"
-        self.assertEqual(format_cli_response(headers), expected)
-
-        # Test bullet points
-        bullets = "* First point* Second point* Third point"
-        expected = "* First point\n* Second point\n* Third point"
-        self.assertEqual(format_cli_response(bullets), expected)
-
-    def test_format_table(self):
-        """Test the table formatting."""
-        headers = ["Name", "Value", "Description"]
-        rows = [
-            ["Item 1", "10", "First item"],
-            ["Item 2", "20", "Second item"],
-            ["Item 3", "30", "Third item with long description"]
-        ]
-
-        # Generate table
-        table = format_table(headers, rows)
-
-        # Check if table contains all headers and row data
-        for header in headers:
-            self.assertIn(header, table)
-
-        for row in rows:
-            for cell in row:
-                self.assertIn(cell, table)
-
-        # Check for empty data handling
-        empty_table = format_table(headers, [])
-        self.assertEqual(empty_table, "No data available.")
-
-        # Test with title
-        titled_table = format_table(headers, rows, title="Test Table")
-        self.assertIn("Test Table", titled_table)
-
-    def test_highlight_text(self):
-        """Test the text highlighting."""
-        test_text = "This is a test string with some important terms to highlight."
-        highlights = ["test", "important", "highlight"]
-
-        # Generate highlighted text
-        highlighted = highlight_text(test_text, highlights)
-
-        # The result should be longer due to ANSI codes
-        self.assertGreater(len(highlighted), len(test_text))
-
-        # Test with empty highlights
-        no_highlights = highlight_text(test_text, [])
-        self.assertEqual(no_highlights, test_text)
-
-        # Test case insensitivity
-        case_text = "Test TEST test"
-        case_highlighted = highlight_text(case_text, ["test"])
-        # All three instances should be highlighted (3 occurrences of "test" in different cases)
-        # Each highlight adds 2 ANSI sequences
-        expected_extra_chars = 3 * (len("\033[1;33m") + len("\033[0m"))
-        self.assertEqual(len(case_highlighted), len(case_text) + expected_extra_chars)
-
-
-if __name__ == "__main__":
-    unittest.main() 
\ No newline at end of file
+import pytest
+from src.utils.formatting import (
+    compile_highlighter,
+    format_cli_response,
+    format_table,
+    highlight_text,
+)
+
+HEADERS = ["Name", "Value", "Description"]
+ROWS = [
+    ["Item 1", "10", "First item"],
+    ["Item 2", "20", "Second item"],
+    ["Item 3", "30", "Third item with long description"]
+]
+HIGHLIGHT_TEXT = "This is a test string with some important terms to highlight."
+HIGHLIGHTS = ["test", "important", "highlight"]
+
+
+@pytest.mark.parametrize("text,expected", [
+    # Numbered list formatting
+    ("1. First item2. Second item3. Third item", "1. First item\n\n2. Second item\n\n3. Third item"),
+    # Header formatting
+    ("# Header\nSome text\n## Subheader\nMore text", "# Header\n\nSome text\n## Subheader\n\nMore text"),
+    # Bullet points
+    ("* First point* Second point* Third point", "* First point\n* Second point\n* Third point"),
+])
+def test_format_cli_response(text, expected):
+    """Test the CLI response formatting."""
+    assert format_cli_response(text) == expected
+
+
+@pytest.mark.parametrize("title", [None, "Test Table"])
+def test_format_table(title):
+    """Test the table formatting."""
+    # Generate table
+    table = format_table(HEADERS, ROWS, title=title)
+
+    # Check if table contains all headers and row data
+    for header in HEADERS:
+        assert header in table
+
+    for row in ROWS:
+        for cell in row:
+            assert cell in table
+
+    if title:
+        assert title in table
+
+
+def test_format_table_empty():
+    """Test empty data handling in table formatting."""
+    assert format_table(HEADERS, []) == "No data available."
+
+
+def test_highlight_text():
+    """Test the text highlighting."""
+    # Generate highlighted text
+    highlighted = highlight_text(HIGHLIGHT_TEXT, HIGHLIGHTS)
+
+    # The result should be longer due to ANSI codes
+    assert len(highlighted) > len(HIGHLIGHT_TEXT)
+
+    # A precompiled highlighter gives the same result as the raw terms
+    assert highlight_text(HIGHLIGHT_TEXT, compile_highlighter(HIGHLIGHTS)) == highlighted
+
+
+def test_highlight_text_empty():
+    """Test highlighting with no terms."""
+    assert highlight_text(HIGHLIGHT_TEXT, []) == HIGHLIGHT_TEXT
+
+
+def test_highlight_text_case_insensitive():
+    """Test the case insensitivity of highlighting."""
+    case_text = "Test TEST test"
+    case_highlighted = highlight_text(case_text, ["test"])
+    # All three instances should be highlighted (3 occurrences of "test" in different cases)
+    # Each highlight adds 2 ANSI sequences
+    expected_extra_chars = 3 * (len("\033[1;33m") + len("\033[0m"))
+    assert len(case_highlighted) == len(case_text) + expected_extra_chars
@@ -0,0 +1,22 @@
+"""
+Tests for the command-line entry point.
+"""
+
+import argparse
+
+import pytest
+
+from src.main import positive_int
+
+
+def test_positive_int_accepts_positive_values():
+    """Positive integers are parsed."""
+    assert positive_int("1") == 1
+    assert positive_int("12") == 12
+
+
+@pytest.mark.parametrize("value", ["0", "-1", "abc", "1.5"])
+def test_positive_int_rejects_invalid_values(value):
+    """Zero, negative and non-integer values are argument errors."""
+    with pytest.raises(argparse.ArgumentTypeError):
+        positive_int(value)
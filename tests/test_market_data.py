@@ -0,0 +1,126 @@
+"""
+Tests for the market data tools.
+"""
+
+import asyncio
+import copy
+
+import orjson
+import pytest
+from pydantic import ValidationError
+from unittest.mock import patch
+
+from src.tools.cache import ToolCache
+from src.tools.market_data import (
+    CompetitorAnalysisTool,
+    ConsumerSentimentTool,
+    MarketTrendAnalysisTool,
+)
+
+TREND_INPUT = {
+    "market_segment": "mobile gaming",
+    "time_period": "Q2 2023",
+    "metrics": ["growth_rate", "market_size", "key_trends"]
+}
+COMPETITOR_INPUT = {
+    "competitors": ["Acme", "Globex"],
+    "metrics": ["market_share", "positioning", "strengths", "weaknesses"],
+    "time_period": "current"
+}
+SENTIMENT_INPUT = {
+    "product_or_brand": "Acme",
+    "channels": ["social_media", "reviews"],
+    "time_period": "last 3 months"
+}
+
+
+@pytest.fixture(autouse=True)
+def no_shared_cache():
+    """Run the tools without Redis, whatever the environment configures."""
+    with patch("src.tools.market_data.get_tool_cache", return_value=ToolCache()):
+        yield
+
+
+def test_trend_result_mutation_does_not_leak():
+    """Mutating one result leaves later results, for any arguments, unchanged."""
+    tool = MarketTrendAnalysisTool()
+    result = tool.invoke(TREND_INPUT)
+    expected = copy.deepcopy(result)
+
+    result["metrics"]["growth_rate"]["value"] = 0
+    result["metrics"]["key_trends"].clear()
+
+    assert tool.invoke(TREND_INPUT) == expected
+    other = tool.invoke({**TREND_INPUT, "market_segment": "luxury fashion"})
+    assert other["metrics"]["growth_rate"]["value"] == 12.5
+    assert other["metrics"]["key_trends"]
+
+
+@pytest.mark.parametrize("tool_cls,tool_input,field", [
+    (CompetitorAnalysisTool, COMPETITOR_INPUT, "competitors"),
+    (ConsumerSentimentTool, SENTIMENT_INPUT, "channels"),
+])
+def test_result_mutation_does_not_leak(tool_cls, tool_input, field):
+    """Each call gets its own copy of the memoised result."""
+    tool = tool_cls()
+    result = tool.invoke(tool_input)
+    expected = copy.deepcopy(result)
+
+    result[field].clear()
+    result["analysis_summary"] = ""
+
+    assert tool.invoke(tool_input) == expected
+
+
+@pytest.mark.parametrize("tool_cls,tool_input", [
+    (MarketTrendAnalysisTool, TREND_INPUT),
+    (CompetitorAnalysisTool, COMPETITOR_INPUT),
+    (ConsumerSentimentTool, SENTIMENT_INPUT),
+])
+def test_cache_hit_matches_miss(tool_cls, tool_input, tool_cache, fake_redis):
+    """A result served from the shared cache is identical, types included, to a fresh one."""
+    tool = tool_cls()
+    with patch("src.tools.market_data.get_tool_cache", return_value=tool_cache):
+        miss = tool.invoke(tool_input)
+        assert len(fake_redis.store) == 1
+        hit = tool.invoke(tool_input)
+
+    assert hit == miss
+    assert repr(hit) == repr(miss)
+    assert hit == tool.invoke(tool_input)
+
+
+@pytest.mark.parametrize("tool_cls,tool_input", [
+    (MarketTrendAnalysisTool, TREND_INPUT),
+    (CompetitorAnalysisTool, COMPETITOR_INPUT),
+    (ConsumerSentimentTool, SENTIMENT_INPUT),
+])
+def test_json_string_input_matches_dict_input(tool_cls, tool_input):
+    """Arguments given as a JSON object string give the same result as a dict."""
+    tool = tool_cls()
+    as_json = orjson.dumps(tool_input).decode()
+
+    assert tool._parse_input(as_json, None) == tool._parse_input(tool_input, None)
+    assert tool.invoke(" " + as_json) == tool.invoke(tool_input)
+
+
+@pytest.mark.parametrize("tool_input", [
+    '{"market_segment": "mobile gaming", ',
+    '{"market_segment": "mobile gaming"}',
+    '{"market_segment": "mobile gaming", "time_period": "Q2 2023", "metrics": "growth_rate"}',
+])
+def test_invalid_json_string_input_raises(tool_input):
+    """Malformed JSON, missing fields and wrong types fail validation."""
+    with pytest.raises(ValidationError):
+        MarketTrendAnalysisTool().invoke(tool_input)
+
+
+@pytest.mark.parametrize("tool_cls,tool_input", [
+    (MarketTrendAnalysisTool, TREND_INPUT),
+    (CompetitorAnalysisTool, COMPETITOR_INPUT),
+    (ConsumerSentimentTool, SENTIMENT_INPUT),
+])
+def test_ainvoke_matches_invoke(tool_cls, tool_input):
+    """Running a tool asynchronously gives the same result as running it synchronously."""
+    tool = tool_cls()
+    assert asyncio.run(tool.ainvoke(tool_input)) == tool.invoke(tool_input)
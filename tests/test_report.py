@@ -0,0 +1,147 @@
+"""
+Tests for the report generation tools.
+"""
+
+import pytest
+
+from src.tools.report import BatchReportGenerationTool, ReportGenerationTool
+
+REPORT_INPUT = {
+    "report_type": "market_overview",
+    "time_period": "Q2 2023",
+    "include_sections": ["executive_summary", "data_analysis", "recommendations"]
+}
+
+
+@pytest.fixture(scope="module")
+def report_tool():
+    """A single report tool shared by the tests."""
+    return ReportGenerationTool()
+
+
+def test_batch_matches_single_reports(report_tool):
+    """Each report in a batch equals the report generated on its own."""
+    requests = [
+        REPORT_INPUT,
+        {**REPORT_INPUT, "time_period": "Q3 2023", "format": "html"},
+        {**REPORT_INPUT, "report_type": "competitor_analysis", "format": "json"},
+    ]
+
+    reports = BatchReportGenerationTool().invoke({"reports": requests})
+
+    assert reports == [report_tool.invoke(request) for request in requests]
+
+
+def test_batch_applies_input_defaults():
+    """Batch entries are validated with the per-report schema and its defaults."""
+    reports = BatchReportGenerationTool().invoke(
+        {"reports": [{"report_type": "market_overview", "time_period": "Q2 2023"}]}
+    )
+
+    assert len(reports) == 1
+    assert list(reports[0]["content"]) == ["executive_summary", "data_analysis", "recommendations"]
+    assert reports[0]["formatted_report"].startswith("# Market Overview Report")
+
+
+def test_html_report_renders_markdown(report_tool):
+    """HTML reports convert the markdown sections, tables included, in requested order."""
+    html = report_tool.invoke({
+        **REPORT_INPUT,
+        "include_sections": ["recommendations", "data_analysis", "executive_summary"],
+        "format": "html"
+    })["formatted_report"]
+
+    assert html.startswith("<!DOCTYPE html>")
+    assert html.rstrip().endswith("</html>")
+    assert "<h1>Market Overview Report</h1>" in html
+    assert "<h2>Q2 2023</h2>" in html
+
+    headings = [
+        "<h2>Strategic Recommendations</h2>",
+        "<h2>Data Analysis</h2>",
+        "<h2>Executive Summary</h2>",
+        "<h2>Data Sources</h2>"
+    ]
+    positions = [html.index(heading) for heading in headings]
+    assert positions == sorted(positions)
+
+    # The channel performance table and the numbered lists are rendered, not left as text
+    assert "<table>" in html
+    assert "<th>Channel</th>" in html
+    assert "<td>Organic Search</td>" in html
+    assert "<ol>" in html
+    assert "|---------|" not in html
+    assert "<li>Internal Analytics</li>" in html
+
+
+@pytest.mark.parametrize("format", ["markdown", "json"])
+def test_sections_follow_requested_order(report_tool, format):
+    """Sections appear in the order they are requested, in content and formatted output."""
+    sections = ["future_outlook", "executive_summary", "competitive_landscape", "data_analysis"]
+    report = report_tool.invoke({**REPORT_INPUT, "include_sections": sections, "format": format})
+
+    assert list(report["content"]) == sections
+    formatted = report["formatted_report"]
+    positions = [formatted.index(report["content"][name].strip().splitlines()[0]) for name in sections]
+    assert positions == sorted(positions)
+
+
+def test_unknown_and_repeated_sections_are_skipped(report_tool):
+    """Unknown section names are ignored and repeated ones generated once."""
+    report = report_tool.invoke({
+        **REPORT_INPUT,
+        "include_sections": ["appendix", "recommendations", "executive_summary", "recommendations"]
+    })
+
+    assert list(report["content"]) == ["recommendations", "executive_summary"]
+    assert "appendix" not in report["formatted_report"].lower()
+    assert report["formatted_report"].count("## Strategic Recommendations") == 1
+
+
+def test_only_unknown_sections_give_an_empty_report(report_tool):
+    """A report with no known sections still has its header and data sources."""
+    report = report_tool.invoke({**REPORT_INPUT, "include_sections": ["appendix"]})
+
+    assert report["content"] == {}
+    assert report["formatted_report"].startswith("# Market Overview Report")
+    assert "## Data Sources" in report["formatted_report"]
+
+
+@pytest.mark.parametrize("format", ["markdown", "html", "json"])
+def test_include_structured_false_omits_content(report_tool, format):
+    """Without structured output the content is left out but the formatted report is unchanged."""
+    request = {**REPORT_INPUT, "format": format}
+    structured = report_tool.invoke(request)
+    unstructured = report_tool.invoke({**request, "include_structured": False})
+
+    assert "content" in structured
+    assert "content" not in unstructured
+    assert unstructured["formatted_report"] == structured["formatted_report"]
+    assert unstructured["meta"] == structured["meta"]
+
+
+@pytest.mark.parametrize("format", ["markdown", "html", "json", "HTML"])
+def test_format_report_bytes_matches_str_report(report_tool, format):
+    """The bytes helper gives the UTF-8 encoding of the formatted report."""
+    report = report_tool.invoke({**REPORT_INPUT, "format": format})
+
+    assert isinstance(report["formatted_report"], str)
+    formatted = report_tool.format_report_bytes(report, format)
+    assert isinstance(formatted, bytes)
+    assert formatted == report["formatted_report"].encode()
+
+
+def test_format_report_bytes_needs_content(report_tool):
+    """Reports generated without their content cannot be reformatted."""
+    report = report_tool.invoke({**REPORT_INPUT, "include_structured": False})
+
+    with pytest.raises(ValueError):
+        report_tool.format_report_bytes(report)
+
+
+def test_format_field_offers_only_text_formats():
+    """The schema the agent sees only offers str-valued formats."""
+    description = ReportGenerationTool().args["format"]["description"]
+
+    assert "bytes" not in description
+    assert "markdown" in description and "html" in description and "json" in description
@@ -0,0 +1,52 @@
+"""
+Tests for the configuration settings.
+"""
+
+import pytest
+
+from src.config import settings
+
+
+@pytest.fixture
+def missing_keys(monkeypatch):
+    """Validate as if no API keys were configured, outside DEBUG_MODE."""
+    monkeypatch.setattr(settings, "DEBUG_MODE", False)
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", None)
+    monkeypatch.setattr(settings, "ENABLE_TRACING", True)
+    monkeypatch.setattr(settings, "LANGSMITH_API_KEY", None)
+    settings.validate_env.cache_clear()
+    yield
+    settings.validate_env.cache_clear()
+
+
+def test_validate_env_reports_missing_keys(missing_keys):
+    """Missing API keys are reported by variable name."""
+    assert set(settings.validate_env()) == {"OPENAI_API_KEY", "LANGSMITH_API_KEY"}
+
+
+def test_validate_env_result_is_read_only(missing_keys):
+    """Callers cannot change the cached result seen by later callers."""
+    issues = settings.validate_env()
+    expected = dict(issues)
+
+    with pytest.raises(AttributeError):
+        issues.pop("OPENAI_API_KEY")
+    with pytest.raises(TypeError):
+        issues["OPENAI_API_KEY"] = "changed"
+
+    assert dict(settings.validate_env()) == expected
+
+
+@pytest.mark.parametrize("value,expected", [(None, 10), ("1", 1), ("25", 25)])
+def test_env_positive_int_accepts_positive_values(monkeypatch, value, expected):
+    """Positive values, or the default when unset, are returned as ints."""
+    monkeypatch.setattr(settings, "_ENV", {} if value is None else {"MEMORY_WINDOW": value})
+    assert settings._env_positive_int("MEMORY_WINDOW", "10") == expected
+
+
+@pytest.mark.parametrize("value", ["0", "-3", "ten"])
+def test_env_positive_int_rejects_invalid_values(monkeypatch, value):
+    """Zero, negative and non-numeric values are rejected."""
+    monkeypatch.setattr(settings, "_ENV", {"MEMORY_WINDOW": value})
+    with pytest.raises(ValueError):
+        settings._env_positive_int("MEMORY_WINDOW", "10")
@@ -0,0 +1,258 @@
+"""
+Tests for the strategy recommendation tool.
+"""
+
+import copy
+import hashlib
+import itertools
+import json
+from pathlib import Path
+
+import orjson
+import pytest
+
+from src.tools.strategy import (
+    _BUDGET_CATEGORIES,
+    _STRATEGY_TEMPLATES,
+    _category_percentages,
+    _compute_recommendation,
+    _generate_risk_assessment,
+    _milestone_offsets,
+    StrategyRecommendation,
+    StrategyRecommendationTool,
+)
+
+STRATEGY_INPUT = {
+    "business_objective": "increase market share",
+    "market_segment": "B2C retail",
+    "time_horizon": "short term",
+    "available_budget": "medium",
+    "current_challenges": ["Limited budget", "Slow adoption of new features"]
+}
+
+# Input grid covered by the baseline digests. Each digest is the SHA-256 of
+# json.dumps of the result the tool gave before it was optimised (baseline
+# commit 0801626), keyed "objective|segment|horizon|variant".
+OBJECTIVES = [
+    "increase_market_share",
+    "Improve Customer Retention",
+    "launch_new_product",
+    "increase brand awareness",
+    "grow_revenue"
+]
+SEGMENTS = [
+    "b2c",
+    "B2B",
+    "retail",
+    "tech",
+    "b2c e_commerce",
+    "b2b saas",
+    "luxury fashion",
+    "B2C consumer_goods lifestyle",
+    "b2c subscription service",
+    "Tech Startups"
+]
+HORIZONS = ["short_term", "Medium Term", "long_term"]
+VARIANTS = {
+    "no_budget": {},
+    "budget": {
+        "available_budget": "medium",
+        "current_challenges": ["Limited budget", "Slow adoption of new features"]
+    }
+}
+BASELINE_DIGESTS = json.loads(
+    (Path(__file__).parent / "data" / "strategy_baseline.json").read_text()
+)
+
+
+@pytest.fixture(scope="module")
+def strategy_tool():
+    """A single strategy tool shared by the tests."""
+    return StrategyRecommendationTool()
+
+
+def test_invoke_returns_dict(strategy_tool):
+    """The tool returns the recommendation dictionary, like the other tools."""
+    result = strategy_tool.invoke(STRATEGY_INPUT)
+
+    assert isinstance(result, dict)
+    assert result["business_objective"] == "increase_market_share"
+    assert result["recommended_strategies"]
+
+
+def test_serialized_result_is_cached(strategy_tool):
+    """The cached JSON decodes to the returned dictionary and is reused on hits."""
+    result = strategy_tool.invoke(STRATEGY_INPUT)
+    args = ("increase_market_share", "b2c_retail", "short_term", "medium",
+            tuple(STRATEGY_INPUT["current_challenges"]))
+
+    recommendation, serialized = _compute_recommendation(*args)
+
+    assert orjson.loads(serialized) == result == recommendation.to_dict()
+    assert _compute_recommendation(*args)[1] is serialized
+
+
+def _digest(result):
+    """SHA-256 of a result's JSON, as recorded in strategy_baseline.json."""
+    return hashlib.sha256(json.dumps(result).encode()).hexdigest()
+
+
+@pytest.mark.parametrize("objective,segment,horizon,variant", list(
+    itertools.product(OBJECTIVES, SEGMENTS, HORIZONS, VARIANTS)
+))
+def test_matches_baseline(strategy_tool, objective, segment, horizon, variant):
+    """Results, key order included, are unchanged from the unoptimised tool."""
+    result = strategy_tool.invoke({
+        "business_objective": objective,
+        "market_segment": segment,
+        "time_horizon": horizon,
+        **VARIANTS[variant]
+    })
+
+    assert _digest(result) == BASELINE_DIGESTS["|".join((objective, segment, horizon, variant))]
+
+
+def _strategy_names(tool, market_segment, time_horizon="short_term"):
+    """Names of the strategies recommended for increasing market share."""
+    result = tool.invoke({
+        "business_objective": "increase_market_share",
+        "market_segment": market_segment,
+        "time_horizon": time_horizon
+    })
+    return [strategy["strategy"] for strategy in result["recommended_strategies"]]
+
+
+def test_segments_match_whole_tokens(strategy_tool):
+    """Segments match on whole underscore-separated tokens, not substrings."""
+    # "retail" is a generic segment, so it filters to retail strategies
+    assert _strategy_names(strategy_tool, "retail") == ["Competitive Pricing Strategy"]
+    # "retailer" is not the token "retail", so every short-term strategy is suitable
+    assert _strategy_names(strategy_tool, "retailer") == _strategy_names(strategy_tool, "luxury fashion")
+    assert _strategy_names(strategy_tool, "retailer") == [
+        "Competitive Pricing Strategy",
+        "Digital Channel Optimization"
+    ]
+    # Multi-token segments still match as a run of tokens
+    assert _strategy_names(strategy_tool, "b2b e_commerce") == [
+        "Competitive Pricing Strategy",
+        "Digital Channel Optimization"
+    ]
+
+
+@pytest.mark.parametrize("risk,mitigation_start", [
+    # Rule order decides, not the position of the keyword in the risk
+    ("Budget overruns from pricing changes", "Implement value-based pricing"),
+    ("Resource delays", "Implement agile methodology"),
+    ("Cost of competitive retaliation", "Develop scenario planning"),
+    ("ROI of engagement campaigns", "Develop staged rollout"),
+    ("Unclear MEASUREMENT of resource use", "Implement comprehensive attribution"),
+    ("Resource dispersion", "Create flexible resourcing plan"),
+    ("Regulatory compliance issues", "Establish monitoring system"),
+])
+def test_mitigation_follows_rule_priority(risk, mitigation_start):
+    """Each risk gets the mitigation of the first rule with a keyword in it."""
+    assessment = _generate_risk_assessment([], (risk,))
+    key = f"Existing challenge: {risk}"
+
+    assert assessment["key_risks"] == [key]
+    assert assessment["mitigation_strategies"][key].startswith(mitigation_start)
+
+
+def test_risks_are_limited_to_five(strategy_tool):
+    """Strategy risks come first, then challenges, capped at five."""
+    result = strategy_tool.invoke({**STRATEGY_INPUT, "market_segment": "luxury fashion"})
+    risks = result["risk_assessment"]["key_risks"]
+
+    assert risks == [
+        "Potential margin erosion",
+        "Competitive retaliation",
+        "Price war escalation",
+        "Rising acquisition costs",
+        "Algorithm changes affecting performance"
+    ]
+    assert list(result["risk_assessment"]["mitigation_strategies"]) == risks
+
+
+@pytest.mark.parametrize("strategy_names", [
+    combo
+    for n in range(1, 5)
+    for combo in itertools.combinations(
+        [template["strategy"] for templates in _STRATEGY_TEMPLATES.values() for template in templates][::3], n
+    )
+])
+def test_category_percentages_sum_to_100(strategy_names):
+    """Category percentages are the rounded shares of a 100% budget."""
+    percentages = _category_percentages(strategy_names)
+
+    assert len(percentages) == len(_BUDGET_CATEGORIES)
+    assert all(pct > 0 for pct in percentages)
+    # Whole-percent rounding can leave the total one point off, as it always has
+    assert abs(sum(percentages) - 100) <= 1
+
+
+@pytest.mark.parametrize("objective", OBJECTIVES)
+def test_budget_allocation_sums_to_100(strategy_tool, objective):
+    """Strategy and category allocations each add up to the whole budget."""
+    result = strategy_tool.invoke({**STRATEGY_INPUT, "business_objective": objective})
+    allocation = result["budget_allocation"]
+
+    by_strategy = [int(pct.rstrip("%")) for pct in allocation["allocation_by_strategy"].values()]
+    by_category = [int(pct.rstrip("%")) for pct in allocation["allocation_by_category"].values()]
+    assert list(allocation["allocation_by_strategy"]) == [
+        strategy["strategy"] for strategy in result["recommended_strategies"]
+    ]
+    assert by_strategy == sorted(by_strategy, reverse=True)
+    assert abs(sum(by_strategy) - 100) <= 1
+    assert list(allocation["allocation_by_category"]) == list(_BUDGET_CATEGORIES)
+    assert abs(sum(by_category) - 100) <= 1
+
+
+@pytest.mark.parametrize("n_tactics,span", list(itertools.product(range(1, 6), range(0, 13))))
+def test_milestone_offsets(n_tactics, span):
+    """Milestones are spread evenly over the phase with floor division."""
+    offsets = _milestone_offsets(n_tactics, span)
+
+    assert offsets == tuple((j * span) // (n_tactics + 1) for j in range(n_tactics))
+    assert offsets[0] == 0
+    assert list(offsets) == sorted(offsets)
+
+
+@pytest.mark.parametrize("horizon", HORIZONS)
+def test_milestones_fall_inside_their_phase(strategy_tool, horizon):
+    """Each milestone is timed within its phase and depends on the previous one."""
+    result = strategy_tool.invoke({**STRATEGY_INPUT, "time_horizon": horizon, "market_segment": "b2c"})
+
+    for phase in result["implementation_plan"]["phases"]:
+        milestones = phase["key_milestones"]
+        assert all(phase["start"] <= m["timeline"] <= phase["end"] for m in milestones)
+        assert [m["dependencies"] for m in milestones] == [[]] + [
+            [f"Milestone {j}"] for j in range(1, len(milestones))
+        ]
+
+
+def test_result_mutation_does_not_leak(strategy_tool):
+    """Each call gets its own copy of the memoised result."""
+    result = strategy_tool.invoke(STRATEGY_INPUT)
+    expected = copy.deepcopy(result)
+
+    result["recommended_strategies"][0]["tactics"].clear()
+    result["recommended_strategies"].clear()
+    result["implementation_plan"]["phases"][0]["key_milestones"][1]["dependencies"].append("x")
+    result["risk_assessment"]["key_risks"].clear()
+    result["budget_allocation"]["allocation_by_category"].clear()
+    result["expected_outcomes"]["primary_metrics"].append("x")
+
+    assert strategy_tool.invoke(STRATEGY_INPUT) == expected
+    # Other inputs sharing the module-level templates are not affected either
+    other = strategy_tool.invoke({**STRATEGY_INPUT, "available_budget": "high"})
+    assert other["recommended_strategies"] == expected["recommended_strategies"]
+
+
+def test_cached_recommendation_is_frozen():
+    """The cached recommendation is a frozen dataclass."""
+    recommendation, _ = _compute_recommendation("launch_new_product", "b2b", "short_term", None, ())
+
+    assert isinstance(recommendation, StrategyRecommendation)
+    with pytest.raises(AttributeError):
+        recommendation.market_segment = "b2c"
+    assert "budget_allocation" not in recommendation.to_dict()